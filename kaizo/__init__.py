@@ -1,8 +1,10 @@
-from .parser import ConfigParser
+from .parser import CompiledConfig, ConfigParser, ConfigTemplate
 from .plugins import Plugin, PluginMetadata
 
 __all__ = (
+    "CompiledConfig",
     "ConfigParser",
+    "ConfigTemplate",
     "Plugin",
     "PluginMetadata",
 )
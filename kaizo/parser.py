@@ -1,33 +1,90 @@
+import os
+import time
+import weakref
+from collections import ChainMap
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from types import ModuleType
+from types import MappingProxyType, ModuleType
 from typing import Any
 
-import yaml
 from typing_extensions import Self
 
-from .plugins import Plugin, PluginMetadata
+from .plugins import Plugin, PluginFactory, PluginIndex, PluginMetadata, PluginScope
 from .utils import (
+    MISSING,
+    ArrayEntry,
+    ArraySpec,
     DictEntry,
     Entry,
+    ExceptionPolicy,
     FieldEntry,
-    FnWithKwargs,
     ListEntry,
+    MapSpec,
     ModuleEntry,
     ModuleLoader,
+    ParserRegistry,
+    PipeEntry,
+    Reference,
+    SeqLock,
+    SharedBackend,
+    SharedBlock,
+    SharedRegistry,
     Storage,
-    extract_variable,
+    approx_size,
+    check_deadline,
+    deadline_scope,
+    is_literal,
+    is_module,
+    is_pipe,
+    load_config,
+    lookup_path,
+    materialize,
+    parse_reference,
+    resolve,
+    resolve_concurrently,
+    walk,
+    warn_fork_unsafe,
 )
 
 
+@dataclass(frozen=True)
+class CompiledConfig:
+    root: Path
+    config: dict[str]
+    kwargs: dict[str] | None = None
+    isolated: bool = True
+    frozen: bool = False
+    parsed: bool = False
+    imports: dict[str, "CompiledConfig"] = field(default_factory=dict)
+
+
 class ConfigParser:
     config: dict[str]
+    source: CompiledConfig
+    root: Path
     local: ModuleType | None
     storage: dict[str, Storage]
+    index: dict[tuple[str, ...], Entry]
+    plugin_storage: dict[str, Storage]
+    plugin_index: dict[tuple[str, ...], Entry]
+    parsed: DictEntry[str] | None
     kwargs: DictEntry[str]
     local_modules: dict[str, Self] | None
-    shared_modules: dict[str, Self] = {}
-    plugins: dict[str, FnWithKwargs[Plugin]] | None
+    shared_modules: ParserRegistry[Self] = ParserRegistry()
+    shared_keys: list[str]
+    lock: SeqLock
+    origin: Self | None
+    shares_entries: bool
+    plugins: dict[str, PluginFactory] | None
     isolated: bool
+    frozen: bool
+    shared: SharedRegistry | None
 
     def __init__(
         self,
@@ -35,16 +92,43 @@ class ConfigParser:
         kwargs: dict[str] | None = None,
         *,
         isolated: bool = True,
+        frozen: bool = False,
     ) -> None:
         config_path = Path(config_path)
 
-        root = config_path.parent
+        self._setup(
+            CompiledConfig(
+                root=config_path.parent,
+                config=load_config(config_path),
+                kwargs=kwargs,
+                isolated=isolated,
+                frozen=frozen,
+            )
+        )
+
+    def _setup(self, source: CompiledConfig) -> None:
+        root = source.root
+        kwargs = source.kwargs
+        isolated = source.isolated
 
+        self.source = source
+        self.root = root
         self.storage = {}
+        self.index = {}
+        self.plugin_storage, self.plugin_index = {}, {}
+        self.parsed = None
+        self.frozen = source.frozen
+        self.shared = None
+        self.lock = SeqLock()
+        self.origin = None
+        self.shares_entries = False
         self.kwargs = DictEntry.from_raw(raw_data=kwargs, resolve=False)
 
-        with config_path.open() as file:
-            self.config = yaml.safe_load(file)
+        self.config = dict(source.config)
+        self.shared_keys = []
+
+        registry = ConfigParser.shared_modules
+        self._release = weakref.finalize(self, registry.release, self.shared_keys)
 
         self.isolated = self.config.pop("isolated", isolated)
 
@@ -70,6 +154,7 @@ class ConfigParser:
                 modules,
                 kwargs,
                 isolated=isolated,
+                compiled=source.imports,
             )
 
             self.local_modules = {}
@@ -77,8 +162,9 @@ class ConfigParser:
             for key, value in imported_modules.items():
                 if value.isolated:
                     self.local_modules[key] = value
-                elif key not in ConfigParser.shared_modules:
-                    ConfigParser.shared_modules[key] = value
+                else:
+                    registry.acquire(key, value)
+                    self.shared_keys.append(key)
 
         else:
             self.local_modules = None
@@ -101,10 +187,15 @@ class ConfigParser:
         kwargs: dict[str] | None = None,
         *,
         isolated: bool = True,
+        compiled: dict[str, CompiledConfig] | None = None,
     ) -> dict[str, Self]:
         module_dict = {}
 
         for module_name, module_path_str in modules.items():
+            if compiled is not None and module_name in compiled:
+                module_dict[module_name] = ConfigParser.from_compiled(compiled[module_name])
+                continue
+
             module_path = Path(module_path_str)
 
             if not module_path.is_absolute():
@@ -120,63 +211,90 @@ class ConfigParser:
     def _import_plugins(
         self,
         plugins: dict[str],
-    ) -> dict[str, FnWithKwargs[Plugin]]:
-        metadata = PluginMetadata()
+    ) -> dict[str, PluginFactory]:
         plugin_dict = {}
 
         for plugin_name, plugin_module in plugins.items():
-            plugin_path = f"kaizo.plugins.{plugin_name}"
+            args = None
+            scope = PluginScope.PARSER
 
             if isinstance(plugin_module, dict):
                 source = plugin_module.get("source")
                 args = plugin_module.get("args", {})
-
-                resolved_args = self._resolve_args(plugin_name, args)
-                metadata.args = resolved_args
+                scope = PluginScope(plugin_module.get("scope", PluginScope.PARSER))
 
                 if source is None:
                     msg = f"source is required for {plugin_name} plugin"
                     raise ValueError(msg)
 
-                plugin = ModuleLoader.load_object(plugin_path, source)
-
             elif isinstance(plugin_module, str):
-                plugin = ModuleLoader.load_object(plugin_path, plugin_module)
+                source = plugin_module
 
             else:
                 msg = f"plugin {plugin_name} is not a valid type"
                 raise TypeError(msg)
 
-            if not issubclass(plugin, Plugin):
-                msg = f"loaded {plugin_name} is not a `Plugin`"
-                raise TypeError(msg)
+            plugin_dict[plugin_name] = PluginFactory(
+                scope=scope,
+                loader=partial(self._load_plugin, plugin_name, source, args),
+            )
+
+        return plugin_dict
 
-            obj = FnWithKwargs[Plugin](fn=plugin.dispatch, kwargs={"metadata": metadata})
+    def _load_plugin(
+        self,
+        plugin_name: str,
+        source: str,
+        args: Any,
+    ) -> Callable[..., Plugin]:
+        plugin_path = PluginIndex.default().module(plugin_name)
+        plugin = ModuleLoader.load_object(plugin_path, source)
+
+        if not isinstance(plugin, type) or not issubclass(plugin, Plugin):
+            msg = f"loaded {plugin_name} is not a `Plugin`"
+            raise TypeError(msg)
 
-            plugin_dict[plugin_name] = obj
+        metadata = PluginMetadata()
 
-        return plugin_dict
+        if args is not None:
+            with self.lock.write(), self._plugin_namespace(plugin_name):
+                metadata.args = self._resolve_args(plugin_name, args, (plugin_name,))
 
-    def _load_symbol_from_module(self, module_path: str, symbol_name: str) -> Any:
-        if module_path == "local":
-            if self.local is None:
-                msg = "local module is not given"
-                raise ValueError(msg)
+        return partial(plugin.dispatch, metadata=metadata)
 
-            return getattr(self.local, symbol_name)
+    @contextmanager
+    def _plugin_namespace(self, plugin_name: str) -> Iterator[None]:
+        storage, index = self.storage, self.index
+        self.plugin_storage[plugin_name] = Storage.init()
 
-        if module_path == "plugin":
-            if self.plugins is None:
-                msg = "plugins are not given"
-                raise ValueError(msg)
+        self.storage = ChainMap(self.plugin_storage, storage)
+        self.index = ChainMap(self.plugin_index, index)
+
+        try:
+            yield
+        finally:
+            self.storage, self.index = storage, index
+
+    def _resolve_plugin(self, plugin_name: str) -> PluginFactory:
+        if self.plugins is None:
+            msg = "plugins are not given"
+            raise ValueError(msg)
 
-            obj = self.plugins.get(symbol_name)
+        plugin = self.plugins.get(plugin_name)
 
-            if obj is None:
-                msg = f"plugin {symbol_name} not found"
+        if plugin is None:
+            msg = f"plugin {plugin_name} not found"
+            raise ValueError(msg)
+
+        return plugin
+
+    def _load_symbol_from_module(self, module_path: str, symbol_name: str) -> Any:
+        if module_path == "local":
+            if self.local is None:
+                msg = "local module is not given"
                 raise ValueError(msg)
 
-            return obj.__call__()
+            return ModuleLoader.load_attribute(self.local, symbol_name)
 
         return ModuleLoader.load_object(module_path, symbol_name)
 
@@ -220,72 +338,142 @@ class ConfigParser:
 
         return storage_i.get(storage_key_to_fetch)
 
+    def _resolve_from_index(self, *, key: str, reference: Reference) -> Entry | None:
+        path = reference.path(key)
+        parsed_entry = self.index.get(path)
+
+        if parsed_entry is not None:
+            return parsed_entry
+
+        parsed_entry = self._resolve_from_literal(key=key, path=path)
+
+        if parsed_entry is not None:
+            self.index[path] = parsed_entry
+            return parsed_entry
+
+        if len(reference.sub_path) > 1:
+            return None
+
+        return self._resolve_from_storage(
+            key=key,
+            entry_key=reference.key,
+            entry_sub_key=reference.sub_key,
+        )
+
+    def _resolve_from_literal(self, *, key: str, path: tuple[str, ...]) -> Entry | None:
+        for i in range(len(path) - 1, 0, -1):
+            literal = self.index.get(path[:i])
+
+            if literal is None:
+                continue
+
+            if not isinstance(literal, FieldEntry):
+                return None
+
+            value = lookup_path(literal.value, path[i:])
+
+            if value is MISSING:
+                return None
+
+            return FieldEntry(key=key, value=value)
+
+        return None
+
+    def _index_entry(self, path: tuple[str, ...], entry: Entry) -> None:
+        if path:
+            self.index[path] = entry
+
+    def _index_args(self, path: tuple[str, ...], args: DictEntry[str] | ListEntry) -> None:
+        items = args._data.items() if isinstance(args, DictEntry) else enumerate(args._data)
+
+        for k, v in items:
+            self._index_entry((*path, str(k)), v)
+
     def _resolve_string(self, key: str, entry: str) -> Entry:
-        entry_module, entry_key, entry_sub_key = extract_variable(entry)
+        reference = parse_reference(entry)
 
-        if entry_module is None:
+        if reference is None:
             return FieldEntry(key=key, value=entry)
 
-        if not entry_module:
-            if entry_sub_key in self.kwargs:
-                return self.kwargs[entry_sub_key]
+        if not reference.module:
+            if reference.sub_key in self.kwargs:
+                return self.kwargs[reference.sub_key]
 
-            parsed_entry = self._resolve_from_storage(
-                key=key,
-                entry_key=entry_key,
-                entry_sub_key=entry_sub_key,
-            )
+            parsed_entry = self._resolve_from_index(key=key, reference=reference)
 
         else:
-            parser = self._resolve_parser(entry_module)
+            parser = self._resolve_parser(reference.module)
 
-            parsed_entry = parser._resolve_from_storage(
-                key=key,
-                entry_key=entry_key,
-                entry_sub_key=entry_sub_key,
-            )
+            parsed_entry = parser._resolve_from_index(key=key, reference=reference)
 
         if parsed_entry is None:
-            msg = f"entry not found, got {entry_sub_key}"
+            msg = f"entry not found, got {reference.sub_key}"
             raise KeyError(msg)
 
         return parsed_entry
 
-    def _resolve_list(self, key: str, entry: list) -> FieldEntry[list]:
+    def _resolve_list(
+        self,
+        key: str,
+        entry: list,
+        path: tuple[str, ...] = (),
+    ) -> FieldEntry[list]:
         return FieldEntry(
             key=key,
-            value=ListEntry([self._resolve_entry(key, e) for e in entry]),
+            value=ListEntry(
+                [self._resolve_entry(key, e, (*path, str(i))) for i, e in enumerate(entry)]
+            ),
         )
 
-    def _resolve_args(self, key: str, args: Any) -> DictEntry[str] | ListEntry:
+    def _resolve_args_reference(
+        self,
+        key: str,
+        source: Entry,
+        path: tuple[str, ...] = (),
+    ) -> DictEntry[str] | ListEntry:
+        value = source.__call__()
+
+        if isinstance(value, dict):
+            value = DictEntry.from_raw(key, value)
+        elif isinstance(value, list):
+            value = ListEntry.from_raw(key, value)
+
+        if not isinstance(value, DictEntry) and not isinstance(value, ListEntry):
+            msg = f"args must be `ListEntry` or `DictEntry`, got {type(value)}"
+            raise TypeError(msg)
+
+        if path:
+            self._index_args(path, value)
+
+        return value
+
+    def _resolve_args(
+        self,
+        key: str,
+        args: Any,
+        path: tuple[str, ...] = (),
+    ) -> DictEntry[str] | ListEntry:
         resolved = None
 
         if key not in self.storage:
             self.storage[key] = Storage.init()
 
         if isinstance(args, dict):
-            resolved = DictEntry()
-            for k, v in args.items():
-                value = self._resolve_entry(key, v)
+            data = {k: self._resolve_entry(key, v, (*path, k)) for k, v in args.items()}
 
-                resolved[k] = value
-                self.storage[key].set(k, value)
+            resolved = DictEntry(data)
+            self.storage[key].update(data)
 
         if isinstance(args, list):
-            resolved = ListEntry()
-            for v in args:
-                resolved.append(self._resolve_entry(key, v))
+            resolved = ListEntry(
+                [self._resolve_entry(key, v, (*path, str(i))) for i, v in enumerate(args)]
+            )
 
         if isinstance(args, str):
-            resolved = self._resolve_string(key=key, entry=args)
+            args = self._resolve_string(key=key, entry=args)
 
-            value = resolved.__call__()
-
-            if not isinstance(value, DictEntry) and not isinstance(value, ListEntry):
-                msg = f"args must be `ListEntry` or `DictEntry`, got {type(value)}"
-                raise TypeError(msg)
-
-            resolved = value
+        if isinstance(args, Entry):
+            resolved = self._resolve_args_reference(key, args, path)
 
         if resolved is None:
             msg = f"invalid type for args, got {type(args)}"
@@ -293,25 +481,53 @@ class ConfigParser:
 
         return resolved
 
-    def _resolve_dict(self, key: str, entry: dict[str]) -> Entry:
+    def _resolve_dict(
+        self,
+        key: str,
+        entry: dict[str],
+        path: tuple[str, ...] = (),
+    ) -> Entry:
+        if is_pipe(entry):
+            return self._resolve_pipe(key, entry, path)
+
         module_path = entry.get("module")
         symbol_name = entry.get("source")
 
         if module_path is None or symbol_name is None:
             return FieldEntry(
                 key=key,
-                value=DictEntry({k: self._resolve_entry(key, v) for k, v in entry.items()}),
+                value=DictEntry(
+                    {k: self._resolve_entry(key, v, (*path, k)) for k, v in entry.items()}
+                ),
             )
 
         call = entry.get("call", True)
         lazy = entry.get("lazy", False)
         args = entry.get("args", {})
         cache = entry.get("cache", True)
-        policy = entry.get("policy")
+        policy = ExceptionPolicy(entry.get("policy", ExceptionPolicy.RAISE))
+        map_spec = entry.get("map")
+        stream = entry.get("stream", False)
+        timeout = entry.get("timeout")
+        fallback = self._resolve_fallback(key, entry, policy, path)
+
+        if map_spec is not None:
+            map_spec = MapSpec.from_raw(map_spec)
+
+        obj = None
+        loader = None
+        reload = False
 
-        obj = self._load_symbol_from_module(module_path, symbol_name)
+        if module_path == "plugin":
+            loader = self._resolve_plugin(symbol_name)
+            reload = loader.scope != PluginScope.PARSER
+        else:
+            obj = self._load_symbol_from_module(module_path, symbol_name)
+
+        if isinstance(args, str):
+            args = self._resolve_string(key=key, entry=args)
 
-        resolved_args = self._resolve_args(key, args)
+        resolved_args = self._resolve_args(key, args, path)
 
         return ModuleEntry(
             key=key,
@@ -321,33 +537,509 @@ class ConfigParser:
             args=resolved_args,
             cache=cache,
             policy=policy,
+            map=map_spec,
+            stream=stream,
+            timeout=timeout,
+            fallback=fallback,
+            args_source=args if isinstance(args, Entry) else None,
+            loader=loader,
+            reload=reload,
+        )
+
+    def _resolve_fallback(
+        self,
+        key: str,
+        entry: dict[str],
+        policy: ExceptionPolicy,
+        path: tuple[str, ...] = (),
+    ) -> Entry | None:
+        if policy != ExceptionPolicy.FALLBACK:
+            return None
+
+        if "fallback" not in entry:
+            msg = f"policy 'fallback' requires a fallback value, got none for '{key}'"
+            raise ValueError(msg)
+
+        return self._resolve_entry(key, entry["fallback"], (*path, "fallback"))
+
+    def _resolve_pipe(
+        self,
+        key: str,
+        entry: dict[str],
+        path: tuple[str, ...] = (),
+    ) -> PipeEntry:
+        resolved = []
+
+        for i, stage in enumerate(entry["pipe"]):
+            value = stage
+
+            if i == 0 and is_module(stage):
+                value = {**stage, "stream": True}
+            elif i > 0 and is_module(stage):
+                value = {"lazy": True, **stage}
+
+            resolved.append(self._resolve_entry(key, value, (*path, "pipe", str(i))))
+
+        return PipeEntry(
+            key=key,
+            stages=ListEntry(resolved),
+            prefetch=entry.get("prefetch", 0),
+        )
+
+    def _resolve_array(self, key: str, entry: ArraySpec) -> ArrayEntry:
+        path = Path(entry.path)
+
+        if not path.is_absolute():
+            path = self.root / path
+
+        return ArrayEntry(
+            key=key,
+            path=path,
+            mmap=entry.mmap,
+            dtype=entry.dtype,
+            shape=entry.shape,
+            offset=entry.offset,
+            mode=entry.mode,
         )
 
-    def _resolve_entry(self, key: str, entry: Any) -> Entry:
+    def _resolve_entry(self, key: str, entry: Any, path: tuple[str, ...] = ()) -> Entry:
         if key in self.kwargs:
-            return self.kwargs[key]
+            resolved = self.kwargs[key]
+        elif isinstance(entry, str):
+            resolved = self._resolve_string(key, entry)
+        elif isinstance(entry, (list, dict)) and is_literal(entry):
+            resolved = FieldEntry(key=key, value=deepcopy(entry))
+        elif isinstance(entry, list):
+            resolved = self._resolve_list(key, entry, path)
+        elif isinstance(entry, dict):
+            resolved = self._resolve_dict(key, entry, path)
+        elif isinstance(entry, ArraySpec):
+            resolved = self._resolve_array(key, entry)
+        else:
+            resolved = FieldEntry(key=key, value=entry)
+
+        self._index_entry(path, resolved)
 
-        if isinstance(entry, str):
-            return self._resolve_string(key, entry)
+        return resolved
 
-        if isinstance(entry, list):
-            return self._resolve_list(key, entry)
+    def parse(self, *, deadline: float | None = None) -> DictEntry[str]:
+        parsed = self.parsed
 
-        if isinstance(entry, dict):
-            return self._resolve_dict(key, entry)
+        if parsed is not None and parsed.frozen:
+            return parsed
 
-        return FieldEntry(key=key, value=entry)
+        with self.lock.write(), deadline_scope(deadline):
+            return self._parse()
 
-    def parse(self) -> DictEntry[str]:
-        res = DictEntry()
+    def _parse(self) -> DictEntry[str]:
+        data = {}
 
         for k in self.config:
+            check_deadline()
+
             if k not in self.storage:
                 self.storage[k] = Storage.init()
 
-            value = self._resolve_entry(k, self.config[k])
+            value = self._resolve_entry(k, self.config[k], (k,))
 
-            res[k] = value
+            data[k] = value
             self.storage[k].value = value
 
+        res = DictEntry(data)
+        self.parsed = res
+
+        if self.frozen:
+            self.freeze()
+
         return res
+
+    def validate(self) -> DictEntry[str]:
+        if self.plugins is not None:
+            for plugin in self.plugins.values():
+                plugin.load()
+
+        if self.local_modules is not None:
+            for module in self.local_modules.values():
+                module.validate()
+
+        parsed = self.parse()
+
+        for entry in list(self.index.values()):
+            if isinstance(entry, ModuleEntry) and entry.loader is not None:
+                entry.validate()
+
+        return parsed
+
+    def freeze(self) -> DictEntry[str]:
+        with self.lock.write():
+            if self.shares_entries and not self.origin.frozen:
+                self._detach()
+
+            parsed = self._ensure_parsed()
+
+            self.frozen = True
+
+            self.kwargs.freeze()
+            parsed.freeze()
+
+            for storage in self.storage.values():
+                storage.items.freeze()
+
+        return parsed
+
+    def _ensure_parsed(self) -> DictEntry[str]:
+        parsed = self.parsed
+
+        if parsed is None:
+            with self.lock.write():
+                if self.parsed is None:
+                    self.parse()
+
+                parsed = self.parsed
+
+        return parsed
+
+    def _lookup(self, path: tuple[str, ...]) -> Entry | None:
+        entry = self.index.get(path)
+
+        if entry is None:
+            entry = self._resolve_from_literal(key=path[0], path=path)
+
+        return entry
+
+    def get_entry(self, key: str) -> Entry:
+        self._ensure_parsed()
+
+        path = tuple(key.split("."))
+
+        entry = self.lock.read(partial(self._lookup, path))
+
+        if entry is None:
+            msg = f"entry not found, got {key}"
+            raise KeyError(msg)
+
+        return entry
+
+    def materialize(
+        self,
+        keys: Iterable[str] | None = None,
+        *,
+        readonly: bool = False,
+        deadline: float | None = None,
+    ) -> dict[str] | Mapping[str]:
+        parsed = self._ensure_parsed()
+
+        if keys is None:
+            keys = parsed.keys()
+
+        with deadline_scope(deadline):
+            res = {key: materialize(self.get_entry(key), readonly=readonly) for key in keys}
+
+        if readonly:
+            return MappingProxyType(res)
+
+        return res
+
+    def share(
+        self,
+        keys: Iterable[str],
+        *,
+        backend: SharedBackend = SharedBackend.SHM,
+    ) -> dict[str, SharedBlock]:
+        if self.shared is None:
+            self.shared = SharedRegistry()
+            weakref.finalize(self, self.shared.close)
+
+        return {
+            key: self.shared.publish(key, self.get_entry(key).__call__(), backend)
+            for key in keys
+        }
+
+    def release_shared(self) -> None:
+        if self.shared is not None:
+            self.shared.close()
+
+    def close(self) -> None:
+        if self.origin is None and self.plugins is not None:
+            for plugin in self.plugins.values():
+                plugin.close()
+
+        if self.origin is None and self.local_modules is not None:
+            for module in self.local_modules.values():
+                module.close()
+
+        if self.origin is None and self.local is not None:
+            ModuleLoader.unload_python_module(self.local)
+
+        for module in self._bound_modules():
+            module.close()
+
+        self._release()
+        self.release_shared()
+
+    def memory_usage(self) -> int:
+        seen = set()
+        size = 0
+
+        for entry in self.index.values():
+            if isinstance(entry, ModuleEntry):
+                size += approx_size(list(entry.bucket.values()), seen)
+            elif isinstance(entry, ArrayEntry) and entry.array is not None:
+                size += approx_size(entry.array, seen)
+
+        if self.local_modules is not None:
+            size += sum(module.memory_usage() for module in self.local_modules.values())
+
+        return size
+
+    @staticmethod
+    def attach(blocks: Mapping[str, SharedBlock]) -> dict[str]:
+        return {key: block.attach() for key, block in blocks.items()}
+
+    def get_many(
+        self,
+        keys: Iterable[str],
+        *,
+        parallel: int = 1,
+        deadline: float | None = None,
+    ) -> dict[str]:
+        entries = {key: self.get_entry(key) for key in keys}
+
+        with deadline_scope(deadline):
+            resolve_concurrently(entries.values(), parallel=parallel)
+
+            return {key: entry.__call__() for key, entry in entries.items()}
+
+    def _warmup_entry(self, key: str) -> float:
+        start = time.perf_counter()
+
+        resolve(self.get_entry(key))
+
+        return time.perf_counter() - start
+
+    def _warmup(self, keys: list[str], parallel: int) -> dict[str, float]:
+        if parallel <= 1:
+            return {key: self._warmup_entry(key) for key in keys}
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            futures = {
+                key: executor.submit(copy_context().run, self._warmup_entry, key)
+                for key in keys
+            }
+
+        return {key: future.result() for key, future in futures.items()}
+
+    def warmup(
+        self,
+        keys: Iterable[str] | None = None,
+        *,
+        parallel: int = 1,
+        check_fork: bool = True,
+        deadline: float | None = None,
+    ) -> dict[str, float]:
+        parsed = self._ensure_parsed()
+
+        keys = list(parsed.keys() if keys is None else keys)
+
+        with deadline_scope(deadline):
+            timings = self._warmup(keys, parallel)
+
+        if check_fork:
+            self.check_fork_safety()
+
+            _fork_checked.add(self)
+
+        return timings
+
+    def cached_results(self) -> dict[str]:
+        results = {}
+
+        for path, entry in self.index.items():
+            if isinstance(entry, ModuleEntry) and entry.bucket:
+                results[".".join(path)] = next(reversed(entry.bucket.values()))
+
+        return results
+
+    def check_fork_safety(self) -> dict[str, str]:
+        return warn_fork_unsafe(self.cached_results())
+
+    def compile(self) -> CompiledConfig:
+        modules = self.source.config.get("import", {})
+        imports = {key: self._resolve_parser(key).compile() for key in modules}
+
+        return replace(
+            self.source,
+            frozen=self.frozen,
+            parsed=self.parsed is not None,
+            imports=imports,
+        )
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledConfig) -> Self:
+        parser = cls.__new__(cls)
+        parser._setup(compiled)
+
+        if compiled.parsed:
+            parser.parse()
+
+        return parser
+
+    def template(self) -> "ConfigTemplate":
+        self._ensure_parsed()
+
+        return ConfigTemplate(self)
+
+    def _plan(self, keys: frozenset[str]) -> tuple["_BindPlan", set[int]]:
+        imports = {}
+        touched = set()
+
+        for name in self.source.config.get("import", {}):
+            plan, module_touched = self._resolve_parser(name)._plan(keys)
+
+            if plan.keys or plan.imports:
+                imports[name] = plan
+                touched |= module_touched
+
+        with self.lock.write():
+            parsed = self._ensure_parsed()
+            by_key: dict[str, list[int]] = {}
+
+            for path, entry in self.index.items():
+                by_key.setdefault(path[0], []).append(id(entry))
+
+            touched.update(id(self.kwargs._data[k]) for k in keys if k in self.kwargs)
+            affected = []
+
+            for key, entry in parsed._data.items():
+                if key in keys or any(id(e) in touched for e in walk(entry)):
+                    affected.append(key)
+                    touched.add(id(entry))
+                    touched.update(by_key.get(key, ()))
+
+        return _BindPlan(keys=affected, imports=imports), touched
+
+    def _bind(self, kwargs: dict[str], plan: "_BindPlan") -> Self:
+        stale = set(plan.keys)
+        registry = ConfigParser.shared_modules
+
+        parser = type(self).__new__(type(self))
+        parser.__dict__.update(self.__dict__)
+
+        with self.lock.write():
+            parsed = self._ensure_parsed()
+            parser.storage = {k: v for k, v in self.storage.items() if k not in stale}
+            parser.index = {p: e for p, e in self.index.items() if p[0] not in stale}
+
+        bound = DictEntry.from_raw(raw_data=kwargs, resolve=False)
+
+        parser.source = replace(
+            self.source, kwargs={**(self.source.kwargs or {}), **kwargs}
+        )
+        parser.kwargs = DictEntry({**self.kwargs._data, **bound._data}, resolve=False)
+        parser.lock = SeqLock()
+        parser.origin = self
+        parser.shares_entries = True
+        parser.shared = None
+        parser.shared_keys = []
+        parser._release = weakref.finalize(parser, registry.release, parser.shared_keys)
+
+        for key in self.shared_keys:
+            module = registry.get(key)
+
+            if module is not None:
+                registry.acquire(key, module)
+                parser.shared_keys.append(key)
+
+        if plan.imports:
+            parser.local_modules = dict(self.local_modules)
+
+            for name, module_plan in plan.imports.items():
+                module = self._resolve_parser(name)._bind(kwargs, module_plan)
+                parser.local_modules[name] = module
+
+        data = dict(parsed._data)
+
+        with parser.lock.write():
+            for key in plan.keys:
+                parser.storage[key] = Storage.init()
+
+                value = parser._resolve_entry(key, self.config[key], (key,))
+
+                data[key] = value
+                parser.storage[key].value = value
+
+            parser.parsed = DictEntry(data)
+
+            if parser.frozen:
+                parser.freeze()
+
+        return parser
+
+    def _bound_modules(self) -> list[Self]:
+        if self.origin is None or self.local_modules is None:
+            return []
+
+        shared = self.origin.local_modules or {}
+
+        return [
+            module
+            for name, module in self.local_modules.items()
+            if module is not shared.get(name)
+        ]
+
+    def _detach(self) -> None:
+        for module in self._bound_modules():
+            module._detach()
+
+        self.storage = {}
+        self.index = {}
+        self.shares_entries = False
+        self._parse()
+
+    def __reduce__(self) -> tuple[Callable[[CompiledConfig], Self], tuple[CompiledConfig]]:
+        return type(self).from_compiled, (self.compile(),)
+
+
+@dataclass(frozen=True)
+class _BindPlan:
+    keys: list[str]
+    imports: dict[str, "_BindPlan"]
+
+
+class ConfigTemplate:
+    parser: ConfigParser
+    _plans: dict[frozenset[str], _BindPlan]
+
+    def __init__(self, parser: ConfigParser) -> None:
+        self.parser = parser
+        self._plans = {}
+
+    def _plan(self, keys: Iterable[str]) -> _BindPlan:
+        keys = frozenset(keys)
+        plan = self._plans.get(keys)
+
+        if plan is None:
+            plan = self._plans[keys] = self.parser._plan(keys)[0]
+
+        return plan
+
+    def dependents(self, keys: Iterable[str]) -> list[str]:
+        return self._plan(keys).keys
+
+    def bind(self, kwargs: dict[str] | None = None) -> ConfigParser:
+        if kwargs is None:
+            kwargs = {}
+
+        return self.parser._bind(kwargs, self._plan(kwargs))
+
+
+_fork_checked: weakref.WeakSet[ConfigParser] = weakref.WeakSet()
+
+
+def _check_before_fork() -> None:
+    for parser in list(_fork_checked):
+        parser.check_fork_safety()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_check_before_fork)
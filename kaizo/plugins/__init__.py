@@ -1,6 +1,11 @@
-from .core import Plugin, PluginMetadata
+from .core import Plugin, PluginFactory, PluginMetadata, PluginScope
+from .index import ENTRY_POINT_GROUP, PluginIndex
 
 __all__ = (
+    "ENTRY_POINT_GROUP",
     "Plugin",
+    "PluginFactory",
+    "PluginIndex",
     "PluginMetadata",
+    "PluginScope",
 )
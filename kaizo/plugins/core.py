@@ -1,8 +1,13 @@
+import threading
+import weakref
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from typing_extensions import Self
 
+from kaizo.utils.common import StrEnum
 from kaizo.utils.entry import DictEntry, ListEntry
+from kaizo.utils.fn import FnWithKwargs
 
 
 @dataclass
@@ -27,3 +32,110 @@ class Plugin:
         plugin.metadata = metadata
 
         return plugin
+
+    def close(self) -> None:
+        return
+
+
+class PluginScope(StrEnum):
+    PARSER = "parser"
+    THREAD = "thread"
+    CALL = "call"
+
+
+class PluginFactory(FnWithKwargs[Plugin]):
+    scope: PluginScope
+    instances: list[Plugin]
+    thread_instances: dict[int, Plugin]
+    loader: Callable[[], Callable[..., Plugin]] | None
+
+    def __init__(
+        self,
+        fn: Callable[..., Plugin] | None = None,
+        args: tuple | None = None,
+        kwargs: dict[str] | None = None,
+        scope: PluginScope = PluginScope.PARSER,
+        *,
+        loader: Callable[[], Callable[..., Plugin]] | None = None,
+    ) -> None:
+        if fn is None and loader is None:
+            msg = "either fn or loader is required for a plugin factory"
+            raise ValueError(msg)
+
+        super().__init__(fn=fn, args=args, kwargs=kwargs)
+
+        self.scope = PluginScope(scope)
+        self.instances = []
+        self.thread_instances = {}
+        self.loader = loader
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.fn is not None
+
+    def load(self) -> Callable[..., Plugin]:
+        if self.fn is None:
+            with self._lock:
+                if self.fn is None:
+                    self.fn = self.loader()
+
+        return self.fn
+
+    def _create(self) -> Plugin:
+        plugin = super().__call__()
+
+        with self._lock:
+            self.instances.append(plugin)
+
+        return plugin
+
+    def _create_local(self) -> Plugin:
+        plugin = super().__call__()
+        key = id(plugin)
+
+        with self._lock:
+            self.thread_instances[key] = plugin
+
+        weakref.finalize(threading.current_thread(), self._drop, key)
+
+        return plugin
+
+    def _drop(self, key: int) -> None:
+        with self._lock:
+            plugin = self.thread_instances.pop(key, None)
+
+        if plugin is not None:
+            plugin.close()
+
+    def __call__(self, *args, **kwargs) -> Plugin:
+        self.load()
+
+        if self.scope == PluginScope.CALL:
+            return super().__call__(*args, **kwargs)
+
+        if self.scope == PluginScope.THREAD:
+            plugin = getattr(self._local, "plugin", None)
+
+            if plugin is None:
+                plugin = self._local.plugin = self._create_local()
+
+            return plugin
+
+        if not self.instances:
+            with self._lock:
+                if not self.instances:
+                    return self._create()
+
+        return self.instances[0]
+
+    def close(self) -> None:
+        with self._lock:
+            instances = [*self.instances, *self.thread_instances.values()]
+            self.instances = []
+            self.thread_instances = {}
+            self._local = threading.local()
+
+        for plugin in instances:
+            plugin.close()
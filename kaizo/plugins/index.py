@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from importlib import metadata
+from pathlib import Path
+
+from typing_extensions import Self
+
+ENTRY_POINT_GROUP = "kaizo.plugins"
+NAMESPACE = "kaizo.plugins"
+
+
+def default_index_path() -> Path:
+    path = os.environ.get("KAIZO_PLUGIN_INDEX")
+
+    if path is not None:
+        return Path(path)
+
+    cache = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+
+    return Path(cache) / "kaizo" / "plugins.json"
+
+
+def fingerprint(paths: list[str] | None = None) -> str:
+    if paths is None:
+        paths = sys.path
+
+    digest = hashlib.sha256(sys.prefix.encode())
+
+    for path in paths:
+        try:
+            mtime = Path(path or ".").stat().st_mtime_ns
+        except OSError:
+            continue
+
+        digest.update(f"\n{path}:{mtime}".encode())
+
+    return digest.hexdigest()
+
+
+class PluginIndex:
+    path: Path
+    _plugins: dict[str, str] | None
+    _lock: threading.Lock
+    _default: "PluginIndex | None" = None
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_index_path()
+        self._plugins = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> Self:
+        if cls._default is None:
+            cls._default = cls()
+
+        return cls._default
+
+    @staticmethod
+    def discover() -> dict[str, str]:
+        return {
+            entry_point.name: entry_point.module
+            for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP)
+        }
+
+    def _read(self, key: str) -> dict[str, str] | None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("fingerprint") != key:
+            return None
+
+        return data.get("plugins")
+
+    def _write(self, key: str, plugins: dict[str, str]) -> None:
+        data = json.dumps({"fingerprint": key, "plugins": plugins})
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(data)
+            tmp.replace(self.path)
+        except OSError:
+            return
+
+    def plugins(self) -> dict[str, str]:
+        if self._plugins is None:
+            with self._lock:
+                if self._plugins is None:
+                    key = fingerprint()
+                    plugins = self._read(key)
+
+                    if plugins is None:
+                        plugins = self.discover()
+                        self._write(key, plugins)
+
+                    self._plugins = plugins
+
+        return self._plugins
+
+    def refresh(self) -> dict[str, str]:
+        with self._lock:
+            plugins = self.discover()
+            self._write(fingerprint(), plugins)
+            self._plugins = plugins
+
+        return plugins
+
+    def module(self, name: str) -> str:
+        return self.plugins().get(name, f"{NAMESPACE}.{name}")
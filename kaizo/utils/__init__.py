@@ -1,22 +1,93 @@
 from .cache import Cacheable
-from .common import extract_variable
-from .entry import DictEntry, Entry, FieldEntry, ListEntry, ModuleEntry
+from .common import (
+    MISSING,
+    Reference,
+    extract_variable,
+    freeze_value,
+    import_numpy,
+    is_literal,
+    is_module,
+    is_pipe,
+    lookup_path,
+    parse_reference,
+)
+from .deadline import call_with_timeout, check_deadline, deadline_scope, remaining
+from .entry import (
+    ArrayEntry,
+    DictEntry,
+    Entry,
+    FieldEntry,
+    ListEntry,
+    ModuleEntry,
+    PipeEntry,
+)
 from .exception import ExceptionHandler, ExceptionPolicy
 from .fn import FnWithKwargs
+from .fork import ForkSafetyWarning, find_fork_unsafe, warn_fork_unsafe
+from .graph import dependencies, dependency_graph, resolve_concurrently, walk
+from .loader import ArraySpec, ConfigLoader, load_config
+from .mapper import MapPool, MapSpec, apply_map, iter_map
+from .materialize import materialize, resolve
 from .module import ModuleLoader
+from .registry import ModuleStats, ParserRegistry, RegistryStats, approx_size
+from .shared import SharedBackend, SharedBlock, SharedRegistry
 from .storage import Storage
+from .stream import Stream, pipeline, prefetch
+from .sync import SeqLock
 
 __all__ = (
+    "MISSING",
+    "ArrayEntry",
+    "ArraySpec",
     "Cacheable",
+    "ConfigLoader",
     "DictEntry",
     "Entry",
     "ExceptionHandler",
     "ExceptionPolicy",
     "FieldEntry",
     "FnWithKwargs",
+    "ForkSafetyWarning",
     "ListEntry",
+    "MapPool",
+    "MapSpec",
     "ModuleEntry",
     "ModuleLoader",
+    "ModuleStats",
+    "ParserRegistry",
+    "PipeEntry",
+    "Reference",
+    "RegistryStats",
+    "SeqLock",
+    "SharedBackend",
+    "SharedBlock",
+    "SharedRegistry",
     "Storage",
+    "Stream",
+    "apply_map",
+    "approx_size",
+    "call_with_timeout",
+    "check_deadline",
+    "deadline_scope",
+    "dependencies",
+    "dependency_graph",
     "extract_variable",
+    "find_fork_unsafe",
+    "freeze_value",
+    "import_numpy",
+    "is_literal",
+    "is_module",
+    "is_pipe",
+    "iter_map",
+    "load_config",
+    "lookup_path",
+    "materialize",
+    "parse_reference",
+    "pipeline",
+    "prefetch",
+    "remaining",
+    "resolve",
+    "resolve_concurrently",
+    "walk",
+    "warn_fork_unsafe",
 )
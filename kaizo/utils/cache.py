@@ -3,13 +3,30 @@ import uuid
 
 class Cacheable:
     _id: str
+    _frozen: bool
+    _hash: int | None
 
     def __init__(self) -> None:
         self._id = uuid.uuid4().hex
+        self._frozen = False
+        self._hash = None
 
     def _update_id(self) -> None:
         self._id = uuid.uuid4().hex
 
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            msg = f"cannot modify a frozen {type(self).__name__}"
+            raise TypeError(msg)
+
+    def freeze(self) -> None:
+        self._frozen = True
+        self._hash = hash((type(self).__name__, self._id))
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
     @property
     def uid(self) -> str:
         return self._id
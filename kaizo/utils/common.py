@@ -1,5 +1,17 @@
+import importlib
 import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Any
+
+VARIABLE_PATTERN = re.compile(r"^(\w*)\.(?:(\w+)\.)?\{(\w*(?:\.\w+)*)\}$")
+LITERAL_TYPES = (str, int, float, bool, bytes, date, type(None))
+PIPE_KEYS = frozenset({"pipe", "prefetch"})
+MISSING = object()
 
 
 class StrEnum(str, Enum):
@@ -7,9 +19,112 @@ class StrEnum(str, Enum):
         return self.value
 
 
-def extract_variable(entry: str) -> tuple[str | None, str | None, str]:
-    matched = re.match(r"^(\w*)\.(?:(\w+)\.)?\{(\w*)\}$", entry)
+@dataclass(frozen=True)
+class Reference:
+    module: str
+    key: str | None
+    sub_key: str
+
+    @property
+    def sub_path(self) -> tuple[str, ...]:
+        if not self.sub_key:
+            return ()
+
+        return tuple(self.sub_key.split("."))
+
+    def path(self, current_key: str) -> tuple[str, ...]:
+        if self.key is not None:
+            return (self.key, *self.sub_path)
+
+        return self.sub_path or (current_key,)
+
+
+@lru_cache(maxsize=4096)
+def parse_reference(entry: str) -> Reference | None:
+    matched = VARIABLE_PATTERN.match(entry)
     if matched is None:
+        return None
+
+    return Reference(*matched.groups())
+
+
+def extract_variable(entry: str) -> tuple[str | None, str | None, str]:
+    reference = parse_reference(entry)
+    if reference is None:
         return None, None, entry
 
-    return matched.groups()
+    return reference.module, reference.key, reference.sub_key
+
+
+def is_module(entry: Any) -> bool:
+    return isinstance(entry, dict) and "module" in entry and "source" in entry
+
+
+def is_pipe(entry: dict[str]) -> bool:
+    stages = entry.get("pipe")
+
+    if not isinstance(stages, list) or not PIPE_KEYS.issuperset(entry):
+        return False
+
+    return bool(stages[1:]) and all(
+        is_module(stage) or (isinstance(stage, str) and parse_reference(stage) is not None)
+        for stage in stages[1:]
+    )
+
+
+def is_literal(entry: Any) -> bool:
+    if isinstance(entry, str):
+        return parse_reference(entry) is None
+
+    if isinstance(entry, list):
+        return all(is_literal(e) for e in entry)
+
+    if isinstance(entry, dict):
+        if is_module(entry) or is_pipe(entry):
+            return False
+
+        return all(is_literal(e) for e in entry.values())
+
+    return isinstance(entry, LITERAL_TYPES)
+
+
+def lookup_path(entry: Any, path: tuple[str, ...]) -> Any:
+    for part in path:
+        if isinstance(entry, Mapping) and part in entry:
+            entry = entry[part]
+            continue
+
+        if not part.isdigit():
+            return MISSING
+
+        index = int(part)
+
+        if isinstance(entry, Mapping):
+            found = index in entry
+        else:
+            found = isinstance(entry, (list, tuple)) and index < len(entry)
+
+        if not found:
+            return MISSING
+
+        entry = entry[index]
+
+    return entry
+
+
+def freeze_value(entry: Any) -> Any:
+    if isinstance(entry, dict):
+        return MappingProxyType({k: freeze_value(v) for k, v in entry.items()})
+
+    if isinstance(entry, list):
+        return tuple(freeze_value(e) for e in entry)
+
+    return entry
+
+
+def import_numpy() -> ModuleType:
+    try:
+        return importlib.import_module("numpy")
+    except ModuleNotFoundError as e:
+        msg = "numpy is required, install `kaizo[numpy]`"
+        raise ImportError(msg) from e
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any
+
+_deadline: ContextVar[float | None] = ContextVar("kaizo_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    if seconds is None:
+        yield
+        return
+
+    end = time.monotonic() + seconds
+    current = _deadline.get()
+
+    if current is not None:
+        end = min(end, current)
+
+    token = _deadline.set(end)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    end = _deadline.get()
+
+    if end is None:
+        return None
+
+    return end - time.monotonic()
+
+
+def check_deadline() -> None:
+    left = remaining()
+
+    if left is not None and left <= 0:
+        msg = "deadline exceeded"
+        raise TimeoutError(msg)
+
+
+def call_with_timeout(fn: Callable[[], Any], timeout: float | None, name: str) -> Any:
+    limits = [t for t in (timeout, remaining()) if t is not None]
+
+    if not limits:
+        return fn()
+
+    limit = min(limits)
+
+    if limit <= 0:
+        msg = f"deadline exceeded before '{name}' was called"
+        raise TimeoutError(msg)
+
+    if timeout is None:
+        return fn()
+
+    context = copy_context()
+    outcome = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = context.run(fn)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name=f"kaizo-{name}", daemon=True)
+    thread.start()
+    thread.join(limit)
+
+    if thread.is_alive():
+        msg = f"'{name}' timed out after {limit:.3g}s"
+        raise TimeoutError(msg)
+
+    if "error" in outcome:
+        raise outcome["error"]
+
+    return outcome["value"]
@@ -1,14 +1,30 @@
+import math
+import threading
 import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Generator, Iterable, MutableMapping, MutableSequence
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+)
 from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
 from typing import Any, Generic, SupportsIndex, TypeVar
 
 from typing_extensions import Self
 
 from .cache import Cacheable
+from .common import MISSING, freeze_value, import_numpy
+from .deadline import call_with_timeout
 from .exception import ExceptionHandler, ExceptionPolicy
 from .fn import FnWithKwargs
+from .mapper import MapCall, MapSpec, apply_map
+from .stream import Stream, pipeline
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -22,16 +38,40 @@ class Entry(ABC):
     def __call__(self) -> Any:
         pass
 
+    def freeze(self) -> None:
+        return
 
-class DictEntry(MutableMapping, Cacheable, Generic[K]):
+
+class FrozenMixin:
+    def __hash__(self) -> int:
+        if not self.frozen:
+            msg = f"unhashable type: '{type(self).__name__}' is not frozen"
+            raise TypeError(msg)
+
+        return self._hash
+
+
+class DictEntry(FrozenMixin, MutableMapping, Cacheable, Generic[K]):
     _data: dict[K, Entry]
     _resolve: bool
+    _lock: threading.Lock
 
     def __init__(self, data: dict[K, Entry] | None = None, *, resolve: bool = True) -> None:
         super().__init__()
 
         self._data = data or {}
         self._resolve = resolve
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @staticmethod
     def from_raw(
@@ -53,12 +93,36 @@ class DictEntry(MutableMapping, Cacheable, Generic[K]):
         return DictEntry(data=data, resolve=resolve)
 
     def __setitem__(self, key: K, value: Any) -> None:
+        self._check_mutable()
+
         if not isinstance(value, Entry):
             msg = f"Value must be an Entry instance, got {type(value)}"
             raise TypeError(msg)
 
-        self._data[key] = value
-        self._update_id()
+        with self._lock:
+            if key in self._data:
+                self._data[key] = value
+            else:
+                self._data = {**self._data, key: value}
+
+            self._update_id()
+
+    def update(self, other: Mapping[K, Entry] = (), /, **kwargs: Entry) -> None:
+        self._check_mutable()
+
+        if isinstance(other, DictEntry):
+            other = other._data
+
+        items = {**dict(other), **kwargs}
+
+        for value in items.values():
+            if not isinstance(value, Entry):
+                msg = f"Value must be an Entry instance, got {type(value)}"
+                raise TypeError(msg)
+
+        with self._lock:
+            self._data = {**self._data, **items}
+            self._update_id()
 
     def __getitem__(self, key: K) -> Any:
         value = self._data[key]
@@ -73,8 +137,14 @@ class DictEntry(MutableMapping, Cacheable, Generic[K]):
         return value
 
     def __delitem__(self, key: K) -> None:
-        self._data.__delitem__(key)
-        self._update_id()
+        self._check_mutable()
+
+        with self._lock:
+            data = dict(self._data)
+            data.__delitem__(key)
+
+            self._data = data
+            self._update_id()
 
     def __iter__(self) -> Generator[K]:
         yield from self._data
@@ -85,16 +155,36 @@ class DictEntry(MutableMapping, Cacheable, Generic[K]):
     def __contains__(self, key: K) -> bool:
         return self._data.__contains__(key)
 
+    def freeze(self) -> None:
+        for value in self._data.values():
+            value.freeze()
+
+        super().freeze()
+
+        self._hash = hash(frozenset(self._data))
 
-class ListEntry(MutableSequence, Cacheable):
+
+class ListEntry(FrozenMixin, MutableSequence, Cacheable):
     _data: list[Entry]
     _resolve: bool
+    _lock: threading.Lock
 
     def __init__(self, data: list[Entry] | None = None, *, resolve: bool = True) -> None:
         super().__init__()
 
         self._data = data or []
         self._resolve = resolve
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @staticmethod
     def from_raw(
@@ -114,6 +204,8 @@ class ListEntry(MutableSequence, Cacheable):
         return ListEntry(data=data, resolve=resolve)
 
     def __setitem__(self, i: SupportsIndex, value: Any) -> None:
+        self._check_mutable()
+
         if isinstance(value, Iterable):
             for value_i in value:
                 if not isinstance(value_i, Entry):
@@ -124,8 +216,9 @@ class ListEntry(MutableSequence, Cacheable):
             msg = f"Value must be an Entry instance, got {type(value)}"
             raise TypeError(msg)
 
-        self._data[i] = value
-        self._update_id()
+        with self._lock:
+            self._data[i] = value
+            self._update_id()
 
     def __getitem__(self, i: SupportsIndex) -> Any:
         value = self._data.__getitem__(i)
@@ -154,19 +247,31 @@ class ListEntry(MutableSequence, Cacheable):
         raise TypeError(msg)
 
     def __delitem__(self, i: SupportsIndex) -> None:
-        self._data.__delitem__(i)
-        self._update_id()
+        self._check_mutable()
+
+        with self._lock:
+            self._data.__delitem__(i)
+            self._update_id()
 
     def __len__(self) -> int:
         return self._data.__len__()
 
     def insert(self, index: SupportsIndex, value: Any) -> None:
+        self._check_mutable()
+
         if not isinstance(value, Entry):
             msg = f"Value must be an Entry instance, got {type(value)}"
             raise TypeError(msg)
 
-        self._data.insert(index, value)
-        self._update_id()
+        with self._lock:
+            self._data.insert(index, value)
+            self._update_id()
+
+    def freeze(self) -> None:
+        for value in self._data:
+            value.freeze()
+
+        super().freeze()
 
 
 @dataclass
@@ -176,6 +281,54 @@ class FieldEntry(Entry, Generic[V]):
     def __call__(self) -> V:
         return self.value
 
+    def freeze(self) -> None:
+        if isinstance(self.value, Cacheable):
+            self.value.freeze()
+        elif isinstance(self.value, (dict, list)):
+            self.value = freeze_value(self.value)
+
+
+@dataclass
+class ArrayEntry(Entry):
+    path: Path
+    mmap: bool = True
+    dtype: str | None = None
+    shape: tuple[int, ...] | None = None
+    offset: int = 0
+    mode: str = "r"
+    array: Any = field(init=False, default=None)
+
+    def _load(self) -> Any:
+        np = import_numpy()
+
+        if self.dtype is not None and self.mmap:
+            return np.memmap(
+                self.path,
+                dtype=self.dtype,
+                mode=self.mode,
+                offset=self.offset,
+                shape=self.shape,
+            )
+
+        if self.dtype is not None:
+            count = -1 if self.shape is None else math.prod(self.shape)
+            array = np.fromfile(
+                self.path, dtype=self.dtype, count=count, offset=self.offset
+            )
+
+            return array if self.shape is None else array.reshape(self.shape)
+
+        if self.mmap:
+            return np.load(self.path, mmap_mode=self.mode)
+
+        return np.load(self.path)
+
+    def __call__(self) -> Any:
+        if self.array is None:
+            self.array = self._load()
+
+        return self.array
+
 
 @dataclass
 class ModuleEntry(Entry):
@@ -185,17 +338,66 @@ class ModuleEntry(Entry):
     args: DictEntry[str] | ListEntry | None = None
     cache: bool = True
     policy: ExceptionPolicy = ExceptionPolicy.RAISE
+    map: MapSpec | None = None
+    stream: bool = False
+    timeout: float | None = None
+    fallback: Entry | None = None
+    args_source: Entry | None = None
+    loader: Callable[[], Any] | None = None
+    reload: bool = False
     fn: FnWithKwargs = field(init=False)
     bucket: dict[str] = field(init=False)
     exception_handler: ExceptionHandler = field(init=False)
+    frozen: bool = field(init=False, default=False)
+    prepared: bool = field(init=False, default=False)
+    result: Any = field(init=False, default=MISSING)
+    lock: threading.RLock = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.bucket = {}
+        self.lock = threading.RLock()
         self.exception_handler = ExceptionHandler(policy=self.policy)
 
-        if self.call is False:
+        if self.loader is None:
+            self.prepare()
+
+    def __getstate__(self) -> dict[str]:
+        state = self.__dict__.copy()
+        del state["lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    def prepare(self) -> None:
+        if self.prepared:
             return
 
+        with self.lock:
+            if self.prepared:
+                return
+
+            if self.map is not None:
+                self._check_map()
+
+            if not self.reload:
+                if self.loader is not None:
+                    self.obj = self.loader()
+
+                if self.call is not False:
+                    self.fn = self._build_fn(self.obj)
+
+            self.prepared = True
+
+    def validate(self) -> None:
+        self.prepare()
+
+        if self.reload and self.call is not False:
+            self._build_fn(self.loader())
+
+    def _build_fn(self, obj: Any) -> FnWithKwargs:
         kwargs = {}
         args = ()
 
@@ -205,38 +407,101 @@ class ModuleEntry(Entry):
             args = self.args
 
         if self.call is True:
-            if not callable(self.obj):
-                msg = f"'{self.obj}' is not callable"
+            if not callable(obj):
+                msg = f"'{obj}' is not callable"
                 raise TypeError(msg)
 
-            self.fn = FnWithKwargs(fn=self.obj, args=args, kwargs=kwargs)
-            return
+            return FnWithKwargs(fn=obj, args=args, kwargs=kwargs)
 
-        if not hasattr(self.obj, self.call):
-            msg = f"'{self.obj}' has no attribute '{self.call}'"
+        if not hasattr(obj, self.call):
+            msg = f"'{obj}' has no attribute '{self.call}'"
             raise AttributeError(msg)
 
-        fn = getattr(self.obj, self.call)
+        fn = getattr(obj, self.call)
 
         if not callable(fn):
             msg = f"'{fn}' is not callable"
             raise TypeError(msg)
 
-        self.fn = FnWithKwargs(fn=fn, args=args, kwargs=kwargs)
+        return FnWithKwargs(fn=fn, args=args, kwargs=kwargs)
+
+    def _current_obj(self) -> Any:
+        if self.reload:
+            return self.loader()
+
+        return self.obj
+
+    def _current_fn(self) -> FnWithKwargs:
+        if self.reload:
+            return self._build_fn(self.loader())
+
+        return self.fn
+
+    def _check_map(self) -> None:
+        if self.call is False or self.lazy:
+            msg = f"map requires a called entry, got '{self.key}'"
+            raise ValueError(msg)
+
+        over = self.map.over
+
+        if isinstance(self.args, ListEntry) and over.isdigit():
+            found = int(over) < len(self.args)
+        else:
+            found = isinstance(self.args, DictEntry) and over in self.args
+
+        if not found:
+            msg = f"map argument '{over}' not found in args of '{self.key}'"
+            raise KeyError(msg)
+
+    def _call_map(self, fn: FnWithKwargs) -> list | Iterator:
+        args = list(fn.args)
+        kwargs = dict(fn.kwargs)
+        over = self.map.over
+
+        items = args.pop(int(over)) if over.isdigit() else kwargs.pop(over)
+
+        call = MapCall(fn=fn.fn, args=tuple(args), kwargs=kwargs, over=over)
+
+        return apply_map(call, items, self.map)
+
+    def _run(self, fn: FnWithKwargs) -> Any:
+        if self.map is not None:
+            return self._call_map(fn)
+
+        return fn.__call__()
 
     def _call_fn(self) -> Any:
         with self.exception_handler:
-            return self.fn.__call__()
+            fn = self._current_fn()
+
+            return call_with_timeout(partial(self._run, fn), self.timeout, self.key)
+
+        if self.policy == ExceptionPolicy.FALLBACK and self.fallback is not None:
+            return self.fallback.__call__()
+
+        return None
+
+    def _execute(self) -> Any:
+        if self.stream:
+            return Stream(self._call_fn)
+
+        return self._call_fn()
 
     def __call__(self) -> Any | FnWithKwargs:
+        if self.result is not MISSING:
+            return self.result
+
+        if not self.prepared:
+            self.prepare()
+
         if self.call is False:
-            return self.obj
+            return self._current_obj()
 
         if self.lazy:
-            return self.fn
+            return self._current_fn()
 
-        if not self.cache:
-            return self._call_fn()
+        if not self.cache or (self.map is not None and self.map.stream):
+            return self._execute()
 
         uid = None
 
@@ -244,6 +509,52 @@ class ModuleEntry(Entry):
             uid = self.args.uid
 
         if uid not in self.bucket:
-            self.bucket[uid] = self._call_fn()
+            with self.lock:
+                if uid not in self.bucket:
+                    self.bucket[uid] = self._execute()
+
+        if self.frozen:
+            self.result = self.bucket[uid]
 
         return self.bucket[uid]
+
+    def freeze(self) -> None:
+        if self.args is not None:
+            self.args.freeze()
+
+        if self.fallback is not None:
+            self.fallback.freeze()
+
+        self.frozen = True
+
+        if not self.prepared or self.reload:
+            return
+
+        if self.call is False:
+            self.result = self.obj
+        elif self.lazy:
+            self.result = self.fn
+
+
+@dataclass
+class PipeEntry(Entry):
+    stages: ListEntry
+    prefetch: int = 0
+
+    def _run(self) -> Iterator:
+        source, *stages = self.stages
+
+        if iter(source) is source:
+            msg = (
+                f"pipe source of '{self.key}' is a one-shot iterator, "
+                "set 'stream: true' on the referenced entry"
+            )
+            raise TypeError(msg)
+
+        return pipeline(source, stages, self.prefetch)
+
+    def __call__(self) -> Stream:
+        return Stream(self._run)
+
+    def freeze(self) -> None:
+        self.stages.freeze()
@@ -10,6 +10,7 @@ from .common import StrEnum
 class ExceptionPolicy(StrEnum):
     RAISE = "raise"
     IGNORE = "ignore"
+    FALLBACK = "fallback"
 
 
 class ExceptionHandler(AbstractContextManager):
@@ -30,7 +31,7 @@ class ExceptionHandler(AbstractContextManager):
         match self._policy:
             case ExceptionPolicy.RAISE:
                 self._exc_handler = self._raise
-            case ExceptionPolicy.IGNORE:
+            case ExceptionPolicy.IGNORE | ExceptionPolicy.FALLBACK:
                 self._exc_handler = self._ignore
 
         return self
@@ -0,0 +1,80 @@
+import sys
+import warnings
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+FORK_UNSAFE_TYPES = (
+    ("concurrent.futures", "Executor"),
+    ("multiprocessing.pool", "Pool"),
+    ("threading", "Thread"),
+    ("socket", "socket"),
+    ("selectors", "BaseSelector"),
+    ("asyncio", "AbstractEventLoop"),
+    ("sqlite3", "Connection"),
+)
+
+
+class ForkSafetyWarning(RuntimeWarning):
+    pass
+
+
+def _unsafe_types() -> tuple[type, ...]:
+    types = []
+
+    for module_name, type_name in FORK_UNSAFE_TYPES:
+        module = sys.modules.get(module_name)
+
+        if module is not None and hasattr(module, type_name):
+            types.append(getattr(module, type_name))
+
+    return tuple(types)
+
+
+def _is_unsafe(value: Any, unsafe_types: tuple[type, ...]) -> bool:
+    if not isinstance(value, unsafe_types):
+        return False
+
+    is_alive = getattr(value, "is_alive", None)
+
+    if callable(is_alive):
+        return is_alive()
+
+    return True
+
+
+def _candidates(value: Any) -> Iterable[Any]:
+    yield value
+
+    if isinstance(value, Mapping):
+        yield from value.values()
+    elif isinstance(value, (list, tuple, set)):
+        yield from value
+    elif hasattr(value, "__dict__"):
+        yield from vars(value).values()
+
+
+def find_fork_unsafe(values: Mapping[str, Any]) -> dict[str, str]:
+    unsafe_types = _unsafe_types()
+
+    if not unsafe_types:
+        return {}
+
+    unsafe = {}
+
+    for key, value in values.items():
+        for candidate in _candidates(value):
+            if _is_unsafe(candidate, unsafe_types):
+                unsafe[key] = type(candidate).__qualname__
+                break
+
+    return unsafe
+
+
+def warn_fork_unsafe(values: Mapping[str, Any]) -> dict[str, str]:
+    unsafe = find_fork_unsafe(values)
+
+    for key, type_name in unsafe.items():
+        msg = f"cached entry '{key}' holds a {type_name}, which is unsafe after fork"
+        warnings.warn(msg, ForkSafetyWarning, stacklevel=3)
+
+    return unsafe
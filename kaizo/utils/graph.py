@@ -0,0 +1,184 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+
+from .entry import (
+    ArrayEntry,
+    DictEntry,
+    Entry,
+    FieldEntry,
+    ListEntry,
+    ModuleEntry,
+    PipeEntry,
+)
+
+
+def _is_node(entry: Entry) -> bool:
+    if isinstance(entry, ArrayEntry):
+        return True
+
+    return (
+        isinstance(entry, ModuleEntry)
+        and entry.cache
+        and not entry.lazy
+        and entry.call is not False
+        and not (entry.map is not None and entry.map.stream)
+    )
+
+
+def _children(entry: Entry, *, deferred: bool = False) -> list[Entry]:
+    value = None
+    extra = []
+
+    if isinstance(entry, ModuleEntry):
+        if not deferred and (entry.lazy or entry.call is False):
+            return []
+
+        if deferred and entry.fallback is not None:
+            extra.append(entry.fallback)
+
+        if deferred and entry.args_source is not None:
+            extra.append(entry.args_source)
+
+        value = entry.args
+
+    elif isinstance(entry, FieldEntry):
+        value = entry.value
+
+    elif isinstance(entry, PipeEntry):
+        value = entry.stages
+
+    if isinstance(value, DictEntry):
+        return [*value._data.values(), *extra]
+
+    if isinstance(value, ListEntry):
+        return [*value._data, *extra]
+
+    return extra
+
+
+def dependencies(entry: Entry) -> list[Entry]:
+    deps = []
+    stack = _children(entry)
+    seen = set()
+
+    while stack:
+        child = stack.pop()
+
+        if id(child) in seen:
+            continue
+
+        seen.add(id(child))
+
+        if _is_node(child):
+            deps.append(child)
+        else:
+            stack.extend(_children(child))
+
+    return deps
+
+
+def walk(entry: Entry) -> Iterator[Entry]:
+    stack = [entry]
+    seen = set()
+
+    while stack:
+        child = stack.pop()
+
+        if id(child) in seen:
+            continue
+
+        seen.add(id(child))
+
+        yield child
+
+        stack.extend(_children(child, deferred=True))
+
+
+def dependency_graph(entries: Iterable[Entry]) -> dict[int, tuple[Entry, set[int]]]:
+    graph = {}
+    stack = []
+
+    for entry in entries:
+        if _is_node(entry):
+            stack.append(entry)
+        else:
+            stack.extend(dependencies(entry))
+
+    stack.reverse()
+
+    while stack:
+        entry = stack.pop()
+
+        if id(entry) in graph:
+            continue
+
+        deps = dependencies(entry)
+
+        graph[id(entry)] = (entry, {id(dep) for dep in deps})
+        stack.extend(deps)
+
+    return graph
+
+
+def _topological(graph: dict[int, tuple[Entry, set[int]]]) -> list[Entry]:
+    order = []
+    done = set()
+
+    for root in graph:
+        stack = [(root, False)]
+
+        while stack:
+            k, expanded = stack.pop()
+
+            if expanded:
+                order.append(graph[k][0])
+                continue
+
+            if k in done:
+                continue
+
+            done.add(k)
+            stack.append((k, True))
+            stack.extend((dep, False) for dep in graph[k][1] if dep not in done)
+
+    return order
+
+
+def resolve_concurrently(entries: Iterable[Entry], parallel: int = 1) -> None:
+    graph = dependency_graph(entries)
+
+    if parallel <= 1:
+        for entry in _topological(graph):
+            entry.__call__()
+
+        return
+
+    waiting = {k: set(deps) for k, (_, deps) in graph.items()}
+    dependents: dict[int, list[int]] = {k: [] for k in graph}
+
+    for k, deps in waiting.items():
+        for dep in deps:
+            dependents[dep].append(k)
+
+    ready = [k for k, deps in waiting.items() if not deps]
+    running: dict[Future, int] = {}
+
+    with ThreadPoolExecutor(max_workers=max(parallel, 1)) as executor:
+        while ready or running:
+            for k in ready:
+                running[executor.submit(copy_context().run, graph[k][0].__call__)] = k
+
+            ready = []
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                k = running.pop(future)
+                future.result()
+
+                for dependent in dependents[k]:
+                    waiting[dependent].discard(k)
+
+                    if not waiting[dependent]:
+                        ready.append(dependent)
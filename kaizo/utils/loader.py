@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+@dataclass(frozen=True)
+class ArraySpec:
+    path: str
+    mmap: bool = True
+    dtype: str | None = None
+    shape: tuple[int, ...] | None = None
+    offset: int = 0
+    mode: str = "r"
+
+
+class ConfigLoader(yaml.SafeLoader):
+    pass
+
+
+def _construct_array(loader: ConfigLoader, node: yaml.Node, *, mmap: bool) -> ArraySpec:
+    if isinstance(node, yaml.ScalarNode):
+        return ArraySpec(path=loader.construct_scalar(node), mmap=mmap)
+
+    if isinstance(node, yaml.MappingNode):
+        spec = loader.construct_mapping(node, deep=True)
+
+        if "path" not in spec:
+            msg = f"path is required for {node.tag} arrays"
+            raise yaml.constructor.ConstructorError(None, None, msg, node.start_mark)
+
+        shape = spec.get("shape")
+
+        if shape is not None:
+            spec["shape"] = tuple(shape)
+
+        return ArraySpec(mmap=mmap, **spec)
+
+    msg = f"{node.tag} expects a path or a mapping"
+    raise yaml.constructor.ConstructorError(None, None, msg, node.start_mark)
+
+
+def _construct_npy(loader: ConfigLoader, node: yaml.Node) -> ArraySpec:
+    return _construct_array(loader, node, mmap=False)
+
+
+def _construct_mmap(loader: ConfigLoader, node: yaml.Node) -> ArraySpec:
+    return _construct_array(loader, node, mmap=True)
+
+
+ConfigLoader.add_constructor("!npy", _construct_npy)
+ConfigLoader.add_constructor("!mmap", _construct_mmap)
+
+
+def load_config(path: Path) -> Any:
+    with path.open() as file:
+        loader = ConfigLoader(file)
+
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
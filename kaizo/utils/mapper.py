@@ -0,0 +1,136 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from typing_extensions import Self
+
+from .common import StrEnum
+from .module import install_local_finder
+
+
+class MapPool(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class MapSpec:
+    over: str
+    pool: MapPool = MapPool.THREAD
+    workers: int | None = None
+    chunksize: int = 1
+    ordered: bool = True
+    stream: bool = False
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Self:
+        if isinstance(raw, (str, int)) and not isinstance(raw, bool):
+            return cls(over=str(raw))
+
+        if not isinstance(raw, dict) or "over" not in raw:
+            msg = f"map expects an argument name or a mapping with 'over', got {raw}"
+            raise ValueError(msg)
+
+        spec = dict(raw)
+        spec["over"] = str(spec["over"])
+        spec["pool"] = MapPool(spec.get("pool", MapPool.THREAD))
+
+        if spec.get("chunksize", 1) < 1:
+            msg = f"map chunksize must be positive, got {spec['chunksize']}"
+            raise ValueError(msg)
+
+        return cls(**spec)
+
+    @property
+    def max_workers(self) -> int:
+        return self.workers or os.cpu_count() or 1
+
+    def executor(self) -> Executor:
+        if self.pool == MapPool.PROCESS:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=install_local_finder
+            )
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+@dataclass(frozen=True)
+class MapCall:
+    fn: Callable
+    args: tuple
+    kwargs: dict[str]
+    over: str
+
+    def __call__(self, item: Any) -> Any:
+        if self.over.isdigit():
+            args = list(self.args)
+            args.insert(int(self.over), item)
+
+            return self.fn(*args, **self.kwargs)
+
+        return self.fn(*self.args, **self.kwargs, **{self.over: item})
+
+
+def _run_chunk(fn: Callable, chunk: list) -> list:
+    return [fn(item) for item in chunk]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def iter_map(fn: Callable, items: Iterable, spec: MapSpec) -> Iterator:
+    limit = spec.max_workers * 2
+    pending = deque()
+
+    with spec.executor() as executor:
+        try:
+            for chunk in _chunks(items, spec.chunksize):
+                pending.append(executor.submit(_run_chunk, fn, chunk))
+
+                if len(pending) < limit:
+                    continue
+
+                if spec.ordered:
+                    yield from pending.popleft().result()
+                    continue
+
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending = deque(not_done)
+
+                for future in done:
+                    yield from future.result()
+
+            if spec.ordered:
+                while pending:
+                    yield from pending.popleft().result()
+            else:
+                for future in as_completed(pending):
+                    yield from future.result()
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def apply_map(fn: Callable, items: Iterable, spec: MapSpec) -> list | Iterator:
+    results = iter_map(fn, items, spec)
+
+    if spec.stream:
+        return results
+
+    return list(results)
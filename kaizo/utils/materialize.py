@@ -0,0 +1,43 @@
+from types import MappingProxyType
+from typing import Any
+
+from .entry import DictEntry, Entry, ListEntry
+
+
+def materialize(value: Any, *, readonly: bool = False) -> Any:
+    if isinstance(value, Entry):
+        value = value.__call__()
+
+    if isinstance(value, (DictEntry, ListEntry)):
+        value = value._data
+
+    if isinstance(value, (dict, MappingProxyType)):
+        data = {k: materialize(v, readonly=readonly) for k, v in value.items()}
+
+        if readonly:
+            return MappingProxyType(data)
+
+        return data
+
+    if isinstance(value, list):
+        data = [materialize(v, readonly=readonly) for v in value]
+
+        if readonly:
+            return tuple(data)
+
+        return data
+
+    return value
+
+
+def resolve(value: Any) -> None:
+    if isinstance(value, Entry):
+        value = value.__call__()
+
+    if isinstance(value, DictEntry):
+        for v in value._data.values():
+            resolve(v)
+
+    elif isinstance(value, ListEntry):
+        for v in value._data:
+            resolve(v)
@@ -1,12 +1,46 @@
 import importlib
 import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
 from importlib.util import module_from_spec, spec_from_file_location
+from itertools import count
 from pathlib import Path
 from types import ModuleType
 from typing import Any
 
+LOCAL_PREFIX = "_kaizo_local_"
+
+_local_ids = count()
+
+
+def local_module_name(path: Path) -> str:
+    return f"{LOCAL_PREFIX}{next(_local_ids)}_{str(path).encode().hex()}"
+
+
+class LocalModuleFinder(MetaPathFinder):
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any = None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if not fullname.startswith(LOCAL_PREFIX):
+            return None
+
+        _, _, encoded = fullname.removeprefix(LOCAL_PREFIX).partition("_")
+
+        return spec_from_file_location(fullname, bytes.fromhex(encoded).decode())
+
+
+def install_local_finder() -> None:
+    if not any(type(f).__name__ == LocalModuleFinder.__name__ for f in sys.meta_path):
+        sys.meta_path.append(LocalModuleFinder())
+
 
 class ModuleLoader:
+    _resolved: dict[tuple[str, str], Any] = {}
+    _failed: dict[tuple[str, str], Exception] = {}
+
     @staticmethod
     def load_python_module(path: Path) -> ModuleType:
         if not path.is_file():
@@ -17,24 +51,83 @@ class ModuleLoader:
         if module_dir not in sys.path:
             sys.path.insert(0, module_dir)
 
-        module_name = path.stem
+        install_local_finder()
+
+        module_name = local_module_name(path.resolve())
         spec = spec_from_file_location(module_name, path)
         if spec is None or spec.loader is None:
             msg = f"Failed to load module from: {path}"
             raise ImportError(msg)
 
         module = module_from_spec(spec)
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+
         return module
 
+    @staticmethod
+    def unload_python_module(module: ModuleType) -> None:
+        if sys.modules.get(module.__name__) is module:
+            del sys.modules[module.__name__]
+
+    @staticmethod
+    def load_attribute(obj: Any, object_name: str) -> Any:
+        for name in object_name.split("."):
+            if not hasattr(obj, name):
+                msg = f"'{getattr(obj, '__name__', obj)}' has no attribute '{name}'"
+                raise AttributeError(msg)
+
+            obj = getattr(obj, name)
+
+        return obj
+
     @staticmethod
     def load_object(module_path: str, object_name: str) -> Any:
+        cache_key = (module_path, object_name)
+
+        if cache_key in ModuleLoader._resolved:
+            return ModuleLoader._resolved[cache_key]
+
+        if cache_key in ModuleLoader._failed:
+            raise ModuleLoader._failed[cache_key].with_traceback(None)
+
+        try:
+            obj = ModuleLoader._import_object(module_path, object_name)
+        except (ImportError, AttributeError) as e:
+            ModuleLoader._failed[cache_key] = e
+            raise
+
+        ModuleLoader._resolved[cache_key] = obj
+
+        return obj
+
+    @staticmethod
+    def clear_cache() -> None:
+        ModuleLoader._resolved.clear()
+        ModuleLoader._failed.clear()
+
+    @staticmethod
+    def _import_object(module_path: str, object_name: str) -> Any:
         try:
             module = importlib.import_module(module_path)
-            if not hasattr(module, object_name):
-                msg = f"Module '{module_path}' has no attribute '{object_name}'"
-                raise AttributeError(msg)
-            return getattr(module, object_name)
         except ModuleNotFoundError as e:
             msg = f"Could not import module '{module_path}': {e}"
             raise ImportError(msg) from e
+
+        attr_name, _, sub_name = object_name.partition(".")
+
+        if not hasattr(module, attr_name):
+            msg = f"Module '{module_path}' has no attribute '{attr_name}'"
+            raise AttributeError(msg)
+
+        obj = getattr(module, attr_name)
+
+        if sub_name:
+            obj = ModuleLoader.load_attribute(obj, sub_name)
+
+        return obj
@@ -0,0 +1,222 @@
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Generic, TypeVar
+
+from .entry import Entry
+
+DEFAULT_MAX_MODULES = 128
+
+T = TypeVar("T")
+
+
+def _children(obj: Any) -> Iterable:
+    if isinstance(obj, (str, bytes, bytearray, Entry)):
+        return ()
+
+    if isinstance(obj, Mapping):
+        return chain.from_iterable(obj.items())
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+
+    if hasattr(obj, "__dict__"):
+        return (vars(obj),)
+
+    return ()
+
+
+def approx_size(obj: Any, seen: set[int] | None = None) -> int:
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+
+        if hasattr(obj, "nbytes") and hasattr(obj, "dtype"):
+            if getattr(obj, "filename", None) is None:
+                size += int(obj.nbytes)
+
+            continue
+
+        size += sys.getsizeof(obj)
+        stack.extend(_children(obj))
+
+    return size
+
+
+@dataclass(frozen=True)
+class ModuleStats:
+    key: str
+    refs: int
+    size: int
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    modules: tuple[ModuleStats, ...]
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def size(self) -> int:
+        return sum(m.size for m in self.modules)
+
+
+class _Record(Generic[T]):
+    value: T
+    refs: int
+    size: int
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+        self.refs = 0
+        self.size = 0
+
+
+class ParserRegistry(Generic[T]):
+    max_modules: int | None
+    max_bytes: int | None
+
+    def __init__(
+        self,
+        max_modules: int | None = DEFAULT_MAX_MODULES,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.max_modules = max_modules
+        self.max_bytes = max_bytes
+
+        self._records: OrderedDict[str, _Record[T]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._records
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def get(self, key: str) -> T | None:
+        with self._lock:
+            record = self._records.get(key)
+
+            if record is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._records.move_to_end(key)
+
+            return record.value
+
+    def acquire(self, key: str, value: T) -> T:
+        with self._lock:
+            record = self._records.get(key)
+
+            if record is None:
+                record = self._records[key] = _Record(value)
+            else:
+                self._records.move_to_end(key)
+
+            record.refs += 1
+
+        if record.value is not value:
+            value.close()
+
+        self._measure(record)
+
+        self.evict()
+
+        return record.value
+
+    def release(self, keys: Iterable[str]) -> None:
+        released = []
+
+        with self._lock:
+            for key in keys:
+                record = self._records.get(key)
+
+                if record is not None and record.refs > 0:
+                    record.refs -= 1
+                    released.append(record)
+
+        for record in released:
+            self._measure(record)
+
+        self.evict()
+
+    def _measure(self, record: _Record[T]) -> None:
+        if self.max_bytes is not None:
+            record.size = record.value.memory_usage()
+
+    def _over_budget(self, size: int) -> bool:
+        if self.max_modules is not None and len(self._records) > self.max_modules:
+            return True
+
+        return self.max_bytes is not None and size > self.max_bytes
+
+    def evict(self) -> list[str]:
+        evicted = {}
+
+        with self._lock:
+            size = sum(r.size for r in self._records.values())
+
+            for key, record in list(self._records.items()):
+                if not self._over_budget(size):
+                    break
+
+                if record.refs > 0:
+                    continue
+
+                del self._records[key]
+                size -= record.size
+                evicted[key] = record.value
+                self._evictions += 1
+
+        for value in evicted.values():
+            value.close()
+
+        return list(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            values = [r.value for r in self._records.values()]
+            self._records.clear()
+
+        for value in values:
+            value.close()
+
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            records = list(self._records.items())
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+
+        for _, record in records:
+            record.size = record.value.memory_usage()
+
+        modules = tuple(
+            ModuleStats(key=key, refs=r.refs, size=r.size) for key, r in records
+        )
+
+        return RegistryStats(
+            modules=modules,
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+        )
@@ -0,0 +1,155 @@
+import mmap
+import sys
+import tempfile
+import uuid
+import weakref
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any
+
+from .common import StrEnum, import_numpy
+
+
+class SharedBackend(StrEnum):
+    SHM = "shm"
+    FILE = "file"
+
+
+@dataclass(frozen=True)
+class SharedBlock:
+    name: str
+    backend: SharedBackend
+    size: int
+    dtype: str | None = None
+    shape: tuple[int, ...] | None = None
+
+    def attach(self) -> Any:
+        value = _attached.get(self.name)
+
+        if value is None:
+            handle, value = self._attach()
+            weakref.finalize(value, _close_handle, handle)
+            _attached[self.name] = value
+
+        return value
+
+    def _attach(self) -> tuple[Any, Any]:
+        if self.backend == SharedBackend.SHM:
+            handle = _open_shared_memory(self.name)
+            buffer = handle.buf
+        else:
+            with Path(self.name).open("rb") as file:
+                handle = mmap.mmap(file.fileno(), self.size, access=mmap.ACCESS_READ)
+            buffer = memoryview(handle)
+
+        if self.dtype is None:
+            return handle, buffer[: self.size].toreadonly()
+
+        np = import_numpy()
+        value = np.ndarray(self.shape, dtype=self.dtype, buffer=buffer)
+        value.flags.writeable = False
+
+        return handle, value
+
+
+_attached: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+
+
+def _close_handle(handle: Any) -> None:
+    try:
+        handle.close()
+    except BufferError:
+        return
+
+
+class _AttachedMemory(shared_memory.SharedMemory):
+    def __del__(self) -> None:
+        return
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return _AttachedMemory(name=name, track=False)
+
+    handle = _AttachedMemory(name=name)
+    resource_tracker.unregister(handle._name, "shared_memory")
+
+    return handle
+
+
+class SharedRegistry:
+    _blocks: dict[str, SharedBlock]
+    _handles: list[shared_memory.SharedMemory]
+    _dir: tempfile.TemporaryDirectory | None
+
+    def __init__(self) -> None:
+        self._blocks = {}
+        self._handles = []
+        self._dir = None
+
+    @property
+    def blocks(self) -> dict[str, SharedBlock]:
+        return dict(self._blocks)
+
+    def publish(
+        self,
+        key: str,
+        value: Any,
+        backend: SharedBackend = SharedBackend.SHM,
+    ) -> SharedBlock:
+        if key in self._blocks:
+            return self._blocks[key]
+
+        dtype = None
+        shape = None
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            data = memoryview(value).cast("B")
+        elif hasattr(value, "__array_interface__"):
+            np = import_numpy()
+            value = np.ascontiguousarray(value)
+            dtype = value.dtype.str
+            shape = value.shape
+            data = memoryview(value.reshape(-1).view(np.uint8))
+        else:
+            msg = f"only arrays and bytes can be shared, got {type(value)}"
+            raise TypeError(msg)
+
+        size = data.nbytes
+
+        if backend == SharedBackend.SHM:
+            handle = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            handle.buf[:size] = data
+            self._handles.append(handle)
+            name = handle.name
+        else:
+            if self._dir is None:
+                self._dir = tempfile.TemporaryDirectory(prefix="kaizo-")
+
+            path = Path(self._dir.name) / uuid.uuid4().hex
+            path.write_bytes(data)
+            name = str(path)
+
+        block = SharedBlock(
+            name=name,
+            backend=SharedBackend(backend),
+            size=size,
+            dtype=dtype,
+            shape=shape,
+        )
+        self._blocks[key] = block
+
+        return block
+
+    def close(self) -> None:
+        for handle in self._handles:
+            handle.close()
+            handle.unlink()
+
+        if self._dir is not None:
+            self._dir.cleanup()
+
+        self._blocks.clear()
+        self._handles.clear()
+        self._dir = None
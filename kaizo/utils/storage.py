@@ -25,3 +25,6 @@ class Storage:
 
     def set(self, key: str, value: Entry) -> None:
         self.items[key] = value
+
+    def update(self, values: dict[str, Entry]) -> None:
+        self.items.update(values)
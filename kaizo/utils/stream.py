@@ -0,0 +1,95 @@
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from queue import Full, Queue
+from typing import Any
+
+_DONE = object()
+_PUT_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class _Failure:
+    error: BaseException
+
+
+def _put(queue: Queue, stop: threading.Event, item: Any) -> bool:
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_PUT_INTERVAL)
+        except Full:
+            continue
+
+        return True
+
+    return False
+
+
+def prefetch(iterable: Iterable, size: int) -> Iterator:
+    queue = Queue(maxsize=size)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(queue, stop, item):
+                    return
+        except Exception as e:
+            _put(queue, stop, _Failure(e))
+            return
+
+        _put(queue, stop, _DONE)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = queue.get()
+
+            if item is _DONE:
+                return
+
+            if isinstance(item, _Failure):
+                raise item.error
+
+            yield item
+    finally:
+        stop.set()
+
+
+class Stream(Iterable):
+    factory: Callable[[], Iterable]
+    prefetch: int
+
+    def __init__(self, factory: Callable[[], Iterable], prefetch: int = 0) -> None:
+        self.factory = factory
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Iterator:
+        iterator = iter(self.factory())
+
+        if self.prefetch > 0:
+            return prefetch(iterator, self.prefetch)
+
+        return iterator
+
+    def __repr__(self) -> str:
+        return f"Stream({self.factory!r})"
+
+
+def pipeline(
+    source: Iterable, stages: Iterable[Callable], prefetch_size: int = 0
+) -> Iterator:
+    iterator = iter(source)
+
+    if prefetch_size > 0:
+        iterator = prefetch(iterator, prefetch_size)
+
+    for stage in stages:
+        iterator = iter(stage(iterator))
+
+        if prefetch_size > 0:
+            iterator = prefetch(iterator, prefetch_size)
+
+    return iterator
@@ -0,0 +1,49 @@
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SeqLock:
+    _lock: threading.RLock
+    _version: int
+    _depth: int
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._version = 0
+        self._depth = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @contextmanager
+    def write(self) -> Generator[None]:
+        with self._lock:
+            self._depth += 1
+
+            if self._depth == 1:
+                self._version += 1
+
+            try:
+                yield
+            finally:
+                self._depth -= 1
+
+                if self._depth == 0:
+                    self._version += 1
+
+    def read(self, fn: Callable[[], T]) -> T:
+        version = self._version
+
+        if version % 2 == 0:
+            result = fn()
+
+            if version == self._version:
+                return result
+
+        with self._lock:
+            return fn()
@@ -1,9 +1,25 @@
-from .common import HFCommit, HFDir, HFPatterns
+from .batch import HFBatch
+from .common import (
+    HFCommit,
+    HFDir,
+    HFIncremental,
+    HFPatterns,
+    HFShards,
+    HFTransfer,
+)
 from .main import HFPlugin
+from .manifest import HFManifest
+from .remote import HFRemoteFile
 
 __all__ = (
+    "HFBatch",
     "HFCommit",
     "HFDir",
+    "HFIncremental",
+    "HFManifest",
     "HFPatterns",
     "HFPlugin",
+    "HFRemoteFile",
+    "HFShards",
+    "HFTransfer",
 )
@@ -0,0 +1,172 @@
+import atexit
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from huggingface_hub import CommitInfo, CommitOperationAdd
+
+DEFAULT_MAX_FILES = 100
+DEFAULT_MAX_BYTES = 1 << 30
+DEFAULT_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class _Pending:
+    path: Path
+    repo_path: str
+    size: int
+    future: Future
+
+
+class HFBatch:
+    max_files: int
+    max_bytes: int
+    interval: float
+
+    def __init__(
+        self,
+        commit: Callable[[list[CommitOperationAdd]], CommitInfo],
+        max_files: int = DEFAULT_MAX_FILES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.interval = interval
+
+        self._commit = commit
+        self._pending: list[_Pending] = []
+        self._bytes = 0
+        self._since: float | None = None
+        self._flush = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="kaizo-hf-batch", daemon=True
+        )
+        self._thread.start()
+
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def submit(self, file_path: Path, repo_path: str) -> Future[CommitInfo]:
+        path = Path(file_path)
+        size = path.stat().st_size
+        future = Future()
+
+        with self._cond:
+            if self._closed:
+                msg = "cannot submit to a closed upload batch"
+                raise RuntimeError(msg)
+
+            self._pending.append(
+                _Pending(path=path, repo_path=repo_path, size=size, future=future)
+            )
+            self._bytes += size
+
+            if self._since is None:
+                self._since = time.monotonic()
+
+            self._cond.notify()
+
+        return future
+
+    def flush(self) -> None:
+        with self._cond:
+            futures = [p.future for p in self._pending]
+            self._flush = True
+            self._cond.notify()
+
+        wait(futures)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._cond.notify()
+
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _due(self) -> bool:
+        if not self._pending:
+            return False
+
+        if self._flush or self._closed:
+            return True
+
+        if len(self._pending) >= self.max_files or self._bytes >= self.max_bytes:
+            return True
+
+        return time.monotonic() - self._since >= self.interval
+
+    def _wait_timeout(self) -> float | None:
+        if self._since is None:
+            return None
+
+        return max(self.interval - (time.monotonic() - self._since), 0)
+
+    def _take(self) -> list[_Pending]:
+        with self._cond:
+            while not self._closed and not self._due():
+                self._cond.wait(self._wait_timeout())
+
+            batch = self._pending[: self.max_files]
+            self._pending = self._pending[self.max_files :]
+            self._bytes = sum(p.size for p in self._pending)
+            self._since = time.monotonic() if self._pending else None
+            self._flush = self._flush and bool(self._pending)
+
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+
+            if not batch:
+                return
+
+            self._send(batch)
+
+    def _send(self, batch: list[_Pending]) -> None:
+        operations = []
+        futures = []
+
+        for pending in batch:
+            if not pending.future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                operation = CommitOperationAdd(
+                    path_in_repo=pending.repo_path,
+                    path_or_fileobj=pending.path,
+                )
+            except Exception as e:
+                pending.future.set_exception(e)
+                continue
+
+            operations.append(operation)
+            futures.append(pending.future)
+
+        if not operations:
+            return
+
+        try:
+            info = self._commit(operations)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+
+            return
+
+        for future in futures:
+            future.set_result(info)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -18,3 +19,30 @@ class HFPatterns:
 class HFCommit:
     message: str | None = None
     description: str | None = None
+
+
+@dataclass(frozen=True)
+class HFIncremental:
+    delete_removed: bool = False
+    max_workers: int = 8
+    manifest: Path | None = None
+
+
+@dataclass(frozen=True)
+class HFShards:
+    max_files: int = 1000
+    max_bytes: int = 5 << 30
+    max_workers: int = 4
+    journal: Path | None = None
+
+
+@dataclass(frozen=True)
+class HFTransfer:
+    name: str
+    path: Path | None = None
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
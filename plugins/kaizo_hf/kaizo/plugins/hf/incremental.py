@@ -0,0 +1,63 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .manifest import file_hash
+from .shards import HFFile
+
+
+@dataclass(frozen=True)
+class HFChanges:
+    changed: list[HFFile]
+    removed: list[str]
+    hashes: dict[str, list]
+
+
+class HFHashes:
+    path: Path
+    records: dict[str, list]
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+        try:
+            self.records = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.records = {}
+
+    def _hash(self, file: HFFile) -> list:
+        record = self.records.get(file.name)
+
+        if record is not None and record[:2] == [file.size, file.mtime]:
+            return record
+
+        return [file.size, file.mtime, file_hash(file.path)]
+
+    def diff(self, files: list[HFFile], max_workers: int = 8) -> HFChanges:
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            hashes = dict(
+                zip(
+                    [f.name for f in files],
+                    executor.map(self._hash, files),
+                    strict=True,
+                )
+            )
+
+        changed = [
+            f
+            for f in files
+            if f.name not in self.records or self.records[f.name][2] != hashes[f.name][2]
+        ]
+        removed = sorted(set(self.records) - set(hashes))
+
+        return HFChanges(changed=changed, removed=removed, hashes=hashes)
+
+    def save(self, hashes: dict[str, list]) -> None:
+        self.records = hashes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(hashes))
+        tmp.replace(self.path)
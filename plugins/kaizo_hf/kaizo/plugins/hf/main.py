@@ -1,13 +1,132 @@
+import io
+import threading
 from asyncio import Future
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from huggingface_hub import CommitInfo, HfApi
+from huggingface_hub import (
+    CommitInfo,
+    CommitOperationAdd,
+    CommitOperationDelete,
+    HfApi,
+    hf_hub_url,
+)
+from huggingface_hub.hf_api import DEFAULT_IGNORE_PATTERNS
+from huggingface_hub.utils import build_hf_headers, filter_repo_objects
 
 from kaizo import Plugin
 
-from .common import HFCommit, HFDir, HFPatterns
+from .batch import DEFAULT_INTERVAL, DEFAULT_MAX_BYTES, DEFAULT_MAX_FILES, HFBatch
+from .common import (
+    HFCommit,
+    HFDir,
+    HFIncremental,
+    HFPatterns,
+    HFShards,
+    HFTransfer,
+)
+from .incremental import HFHashes
+from .manifest import HFManifest, is_pinned
+from .remote import DEFAULT_BLOCK_SIZE, DEFAULT_READ_AHEAD, HFRemoteFile
+from .shards import HFJournal, default_state_path, list_files, split_shards
+
+
+def _to_commit(commit: HFCommit | Mapping[str] | None) -> HFCommit:
+    if commit is None:
+        return HFCommit()
+
+    if isinstance(commit, Mapping):
+        return HFCommit(**commit)
+
+    return commit
+
+
+def _to_dir(file_dir: HFDir | Mapping[str] | None) -> HFDir:
+    if file_dir is None:
+        return HFDir()
+
+    if isinstance(file_dir, Mapping):
+        return HFDir(**file_dir)
+
+    return file_dir
+
+
+def _to_patterns(patterns: HFPatterns | Mapping[str] | None) -> HFPatterns:
+    if patterns is None:
+        return HFPatterns()
+
+    if isinstance(patterns, Mapping):
+        return HFPatterns(**patterns)
+
+    return patterns
+
+
+def _with_default_ignore(patterns: HFPatterns) -> HFPatterns:
+    ignore = patterns.ignore or []
+
+    if isinstance(ignore, str):
+        ignore = [ignore]
+
+    return replace(patterns, ignore=[*ignore, *DEFAULT_IGNORE_PATTERNS])
+
+
+def _to_shards(shards: HFShards | Mapping[str] | None) -> HFShards:
+    if shards is None:
+        return HFShards()
+
+    if isinstance(shards, Mapping):
+        return HFShards(**shards)
+
+    return shards
+
+
+def _to_incremental(incremental: HFIncremental | Mapping[str] | bool) -> HFIncremental:
+    if isinstance(incremental, HFIncremental):
+        return incremental
+
+    if isinstance(incremental, Mapping):
+        return HFIncremental(**incremental)
+
+    return HFIncremental()
+
+
+def _repo_name(repo_path: str | None, name: str) -> str:
+    repo_path = (repo_path or "").strip("/")
+
+    if repo_path in {"", "."}:
+        return name
+
+    return f"{repo_path}/{name}"
+
+
+def _to_manifest(manifest: HFManifest | Mapping[str] | Path | None) -> HFManifest:
+    if isinstance(manifest, HFManifest):
+        return manifest
+
+    if isinstance(manifest, Mapping):
+        return HFManifest(**manifest)
+
+    return HFManifest(manifest)
+
+
+def _run_all(
+    fn: Callable[[Any], Any],
+    items: list,
+    max_workers: int,
+) -> list[tuple[Any, BaseException | None]]:
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+
+    outcomes = []
+
+    for future in futures:
+        error = future.exception()
+        outcomes.append((None if error else future.result(), error))
+
+    return outcomes
 
 
 class HFPlugin(Plugin):
@@ -17,6 +136,7 @@ class HFPlugin(Plugin):
         repo_id: str,
         repo_type: Literal["dataset", "model", "space"] | None = None,
         revision: str | None = None,
+        manifest: HFManifest | Mapping[str] | Path | None = None,
     ) -> None:
         super().__init__()
 
@@ -24,6 +144,23 @@ class HFPlugin(Plugin):
         self.repo_id = repo_id
         self.repo_type = repo_type
         self.revision = revision
+        self.manifest = _to_manifest(manifest)
+        self.uploads = None
+        self.lock = threading.RLock()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.uploads is not None:
+                self.uploads.close()
+                self.uploads = None
+
+        self.manifest.close()
+
+    def _manifest_key(self, *parts: object) -> str | None:
+        if not is_pinned(self.revision):
+            return None
+
+        return HFManifest.key(self.repo_type, self.repo_id, self.revision, *parts)
 
     def upload_file(
         self,
@@ -32,12 +169,19 @@ class HFPlugin(Plugin):
         *,
         run_as_future: bool = True,
         commit: HFCommit | Mapping[str] | None = None,
+        batch: bool = False,
     ) -> Future[CommitInfo] | CommitInfo:
-        if commit is None:
-            commit = HFCommit()
+        if batch:
+            if commit is not None:
+                msg = "commit cannot be set with batch, batched files share one commit"
+                raise ValueError(msg)
 
-        if isinstance(commit, Mapping):
-            commit = HFCommit(**commit)
+            with self.lock:
+                uploads = self.uploads or self.batch()
+
+            return uploads.submit(file_path, repo_path)
+
+        commit = _to_commit(commit)
 
         return self.api.upload_file(
             repo_id=self.repo_id,
@@ -50,19 +194,114 @@ class HFPlugin(Plugin):
             commit_description=commit.description,
         )
 
-    def upload_folder(
+    def _commit_operations(self, operations: list[CommitOperationAdd]) -> CommitInfo:
+        return self.api.create_commit(
+            repo_id=self.repo_id,
+            operations=operations,
+            repo_type=self.repo_type,
+            revision=self.revision,
+            commit_message=f"Upload {len(operations)} files",
+        )
+
+    def batch(
+        self,
+        max_files: int = DEFAULT_MAX_FILES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> HFBatch:
+        with self.lock:
+            if self.uploads is not None:
+                self.uploads.close()
+
+            self.uploads = HFBatch(
+                self._commit_operations,
+                max_files=max_files,
+                max_bytes=max_bytes,
+                interval=interval,
+            )
+
+            return self.uploads
+
+    def upload_files(
+        self,
+        files: Mapping[Path, str] | Iterable[tuple[Path, str]],
+        max_workers: int = 8,
+        *,
+        commit: HFCommit | Mapping[str] | None = None,
+    ) -> list[HFTransfer]:
+        if isinstance(files, Mapping):
+            files = files.items()
+
+        pairs = [(Path(file_path), repo_path) for file_path, repo_path in files]
+        commit = _to_commit(commit)
+
+        def preupload(pair: tuple[Path, str]) -> CommitOperationAdd:
+            operation = CommitOperationAdd(path_in_repo=pair[1], path_or_fileobj=pair[0])
+
+            self.api.preupload_lfs_files(
+                repo_id=self.repo_id,
+                additions=[operation],
+                repo_type=self.repo_type,
+                revision=self.revision,
+            )
+
+            return operation
+
+        outcomes = _run_all(preupload, pairs, max_workers)
+        operations = [operation for operation, error in outcomes if error is None]
+
+        info = None
+        commit_error = None
+
+        if operations:
+            try:
+                info = self.api.create_commit(
+                    repo_id=self.repo_id,
+                    operations=operations,
+                    repo_type=self.repo_type,
+                    revision=self.revision,
+                    commit_message=commit.message or f"Upload {len(operations)} files",
+                    commit_description=commit.description,
+                )
+            except Exception as e:
+                commit_error = e
+
+        return [
+            HFTransfer(
+                name=repo_path,
+                path=file_path,
+                result=None if error else info,
+                error=error or commit_error,
+            )
+            for (file_path, repo_path), (_, error) in zip(pairs, outcomes, strict=True)
+        ]
+
+    def upload_folder(  # noqa: PLR0913
         self,
         folder_path: Path,
         repo_path: str,
+        patterns: HFPatterns | Mapping[str] | None = None,
         *,
         run_as_future: bool = True,
         commit: HFCommit | Mapping[str] | None = None,
-    ) -> Future[CommitInfo] | CommitInfo:
-        if commit is None:
-            commit = HFCommit()
+        incremental: HFIncremental | Mapping[str] | bool = False,
+    ) -> Future[CommitInfo] | CommitInfo | None:
+        patterns = _to_patterns(patterns)
+        commit = _to_commit(commit)
 
-        if isinstance(commit, Mapping):
-            commit = HFCommit(**commit)
+        if incremental:
+            push = self._upload_changes(
+                Path(folder_path),
+                repo_path,
+                commit,
+                _to_incremental(incremental),
+                patterns,
+            )
+
+            if run_as_future:
+                return self.api.run_as_future(push)
+
+            return push()
 
         return self.api.upload_folder(
             repo_id=self.repo_id,
@@ -73,8 +312,144 @@ class HFPlugin(Plugin):
             run_as_future=run_as_future,
             commit_message=commit.message,
             commit_description=commit.description,
+            allow_patterns=patterns.allow,
+            ignore_patterns=patterns.ignore,
         )
 
+    def _upload_changes(
+        self,
+        folder_path: Path,
+        repo_path: str,
+        commit: HFCommit,
+        incremental: HFIncremental,
+        patterns: HFPatterns,
+    ) -> Callable[[], CommitInfo | None]:
+        hashes = HFHashes(
+            incremental.manifest
+            or default_state_path(
+                "hashes",
+                self.repo_type,
+                self.repo_id,
+                self.revision,
+                folder_path.resolve(),
+                repo_path,
+            )
+        )
+
+        files = list_files(folder_path, _with_default_ignore(patterns))
+        changes = hashes.diff(files, incremental.max_workers)
+
+        operations = [
+            CommitOperationAdd(
+                path_in_repo=_repo_name(repo_path, f.name),
+                path_or_fileobj=f.path,
+            )
+            for f in changes.changed
+        ]
+
+        records = dict(changes.hashes)
+
+        if incremental.delete_removed:
+            operations.extend(
+                CommitOperationDelete(path_in_repo=_repo_name(repo_path, name))
+                for name in changes.removed
+            )
+        else:
+            records.update({name: hashes.records[name] for name in changes.removed})
+
+        def push() -> CommitInfo | None:
+            if not operations:
+                hashes.save(records)
+                return None
+
+            info = self.api.create_commit(
+                repo_id=self.repo_id,
+                operations=operations,
+                repo_type=self.repo_type,
+                revision=self.revision,
+                commit_message=commit.message or f"Upload {len(operations)} changed files",
+                commit_description=commit.description,
+            )
+
+            hashes.save(records)
+
+            return info
+
+        return push
+
+    def upload_large_folder(
+        self,
+        folder_path: Path,
+        repo_path: str,
+        patterns: HFPatterns | Mapping[str] | None = None,
+        shards: HFShards | Mapping[str] | None = None,
+        *,
+        commit: HFCommit | Mapping[str] | None = None,
+    ) -> list[CommitInfo]:
+        folder_path = Path(folder_path)
+        patterns = _with_default_ignore(_to_patterns(patterns))
+        shards = _to_shards(shards)
+        commit = _to_commit(commit)
+
+        journal = HFJournal(
+            shards.journal
+            or default_state_path(
+                self.repo_type,
+                self.repo_id,
+                self.revision,
+                folder_path.resolve(),
+                repo_path,
+            )
+        )
+
+        files = [f for f in list_files(folder_path, patterns) if not journal.is_done(f)]
+        batches = split_shards(files, shards.max_files, shards.max_bytes)
+
+        def preupload(batch: list) -> list[CommitOperationAdd]:
+            operations = [
+                CommitOperationAdd(
+                    path_in_repo=_repo_name(repo_path, f.name),
+                    path_or_fileobj=f.path,
+                )
+                for f in batch
+            ]
+
+            self.api.preupload_lfs_files(
+                repo_id=self.repo_id,
+                additions=operations,
+                repo_type=self.repo_type,
+                revision=self.revision,
+            )
+
+            return operations
+
+        infos = []
+
+        with ThreadPoolExecutor(max_workers=max(shards.max_workers, 1)) as executor:
+            futures = [executor.submit(preupload, batch) for batch in batches]
+
+            try:
+                for i, (batch, future) in enumerate(zip(batches, futures, strict=True)):
+                    info = self.api.create_commit(
+                        repo_id=self.repo_id,
+                        operations=future.result(),
+                        repo_type=self.repo_type,
+                        revision=self.revision,
+                        commit_message=commit.message
+                        or f"Upload shard {i + 1}/{len(batches)}",
+                        commit_description=commit.description,
+                    )
+
+                    journal.record(batch)
+                    infos.append(info)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        journal.clear()
+
+        return infos
+
     def download_file(
         self,
         file_name: str,
@@ -82,12 +457,16 @@ class HFPlugin(Plugin):
         *,
         force_download: bool = False,
         local_files_only: bool = False,
+        refresh: bool = False,
     ) -> Path:
-        if file_dir is None:
-            file_dir = HFDir()
+        file_dir = _to_dir(file_dir)
+        key = self._manifest_key(file_name, file_dir.local, file_dir.cache)
 
-        if isinstance(file_dir, Mapping):
-            file_dir = HFDir(**file_dir)
+        if key is not None and not (force_download or refresh):
+            cached = self.manifest.get(key)
+
+            if cached is not None:
+                return cached
 
         res = self.api.hf_hub_download(
             repo_id=self.repo_id,
@@ -101,9 +480,94 @@ class HFPlugin(Plugin):
             dry_run=False,
         )
 
+        if key is not None:
+            self.manifest.put(key, Path(res))
+
         return Path(res)
 
-    def snapshot_download(
+    def download_files(  # noqa: PLR0913
+        self,
+        file_names: Iterable[str],
+        file_dir: HFDir | Mapping[str] | None = None,
+        max_workers: int = 8,
+        *,
+        force_download: bool = False,
+        local_files_only: bool = False,
+        refresh: bool = False,
+    ) -> list[HFTransfer]:
+        file_names = list(file_names)
+        file_dir = _to_dir(file_dir)
+
+        def download(file_name: str) -> Path:
+            return self.download_file(
+                file_name,
+                file_dir,
+                force_download=force_download,
+                local_files_only=local_files_only,
+                refresh=refresh,
+            )
+
+        outcomes = _run_all(download, file_names, max_workers)
+        self.manifest.flush()
+
+        return [
+            HFTransfer(name=file_name, path=path, result=path, error=error)
+            for file_name, (path, error) in zip(file_names, outcomes, strict=True)
+        ]
+
+    def open_file(
+        self,
+        file_name: str,
+        mode: str = "rb",
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        cache_dir: Path | None = None,
+    ) -> io.BufferedReader | io.TextIOWrapper:
+        if mode not in {"rb", "r"}:
+            msg = f"unsupported mode '{mode}', expected 'rb' or 'r'"
+            raise ValueError(msg)
+
+        url = hf_hub_url(
+            repo_id=self.repo_id,
+            filename=file_name,
+            repo_type=self.repo_type,
+            revision=self.revision,
+            endpoint=self.api.endpoint,
+        )
+
+        raw = HFRemoteFile(
+            url,
+            headers=build_hf_headers(token=self.api.token),
+            block_size=block_size,
+            read_ahead=read_ahead,
+            cache_dir=cache_dir,
+        )
+        reader = io.BufferedReader(raw, buffer_size=block_size)
+
+        if mode == "rb":
+            return reader
+
+        return io.TextIOWrapper(reader, encoding="utf-8")
+
+    def iter_files(
+        self,
+        pattern: list[str] | str,
+        mode: str = "rb",
+        *,
+        cache_dir: Path | None = None,
+    ) -> Iterator[tuple[str, io.BufferedReader | io.TextIOWrapper]]:
+        file_names = self.api.list_repo_files(
+            repo_id=self.repo_id,
+            repo_type=self.repo_type,
+            revision=self.revision,
+        )
+
+        for file_name in filter_repo_objects(file_names, allow_patterns=pattern):
+            with self.open_file(file_name, mode, cache_dir=cache_dir) as file:
+                yield file_name, file
+
+    def snapshot_download(  # noqa: PLR0913
         self,
         folder_dir: HFDir | Mapping[str] | None = None,
         patterns: HFPatterns | Mapping[str] | None = None,
@@ -111,18 +575,22 @@ class HFPlugin(Plugin):
         *,
         force_download: bool = False,
         local_files_only: bool = False,
+        refresh: bool = False,
     ) -> Path:
-        if folder_dir is None:
-            folder_dir = HFDir()
-
-        if isinstance(folder_dir, Mapping):
-            folder_dir = HFDir(**folder_dir)
+        folder_dir = _to_dir(folder_dir)
+        patterns = _to_patterns(patterns)
+        key = self._manifest_key(
+            folder_dir.local,
+            folder_dir.cache,
+            patterns.allow,
+            patterns.ignore,
+        )
 
-        if patterns is None:
-            patterns = HFPatterns()
+        if key is not None and not (force_download or refresh):
+            cached = self.manifest.get(key)
 
-        if isinstance(patterns, Mapping):
-            patterns = HFPatterns(**patterns)
+            if cached is not None:
+                return cached
 
         res = self.api.snapshot_download(
             repo_id=self.repo_id,
@@ -138,4 +606,7 @@ class HFPlugin(Plugin):
             dry_run=False,
         )
 
+        if key is not None:
+            self.manifest.put(key, Path(res))
+
         return Path(res)
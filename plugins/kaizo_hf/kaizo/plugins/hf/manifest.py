@@ -0,0 +1,233 @@
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from huggingface_hub import constants
+from huggingface_hub.utils import WeakFileLock
+
+PINNED_REVISION = re.compile(r"^[0-9a-f]{40}$")
+CHUNK_SIZE = 1 << 20
+DEFAULT_MAX_PENDING = 64
+DEFAULT_INTERVAL = 5.0
+
+
+def is_pinned(revision: str | None) -> bool:
+    return revision is not None and PINNED_REVISION.match(revision) is not None
+
+
+def file_hash(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def default_manifest_path() -> Path:
+    return Path(constants.HF_HUB_CACHE) / "kaizo" / "manifest.json"
+
+
+class HFManifest:
+    path: Path
+    refresh: bool
+    max_pending: int
+    interval: float
+    _entries: dict[str, dict] | None
+    _pending: dict[str, dict | None]
+    _hashing: dict[str, Future]
+    _since: float | None
+    _lock: threading.Lock
+    _executor: ThreadPoolExecutor | None
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        refresh: bool = False,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_manifest_path()
+        self.refresh = refresh
+        self.max_pending = max_pending
+        self.interval = interval
+        self._entries = None
+        self._pending = {}
+        self._hashing = {}
+        self._since = None
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        return json.dumps([None if p is None else str(p) for p in parts])
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = self._read()
+
+        return self._entries
+
+    @staticmethod
+    def _verify(record: dict, path: Path) -> bool | None:
+        if "size" not in record:
+            return path.exists()
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+
+        if stat.st_size != record["size"]:
+            return False
+
+        if stat.st_mtime_ns == record["mtime"]:
+            return True
+
+        if record["sha256"] is None or file_hash(path) != record["sha256"]:
+            return False
+
+        return None
+
+    def get(self, key: str) -> Path | None:
+        if self.refresh:
+            return None
+
+        with self._lock:
+            record = self._load().get(key)
+            future = self._hashing.get(key)
+
+        if record is None:
+            return None
+
+        if future is not None:
+            future.result()
+
+        path = Path(record["path"])
+        verified = self._verify(record, path)
+
+        if verified is False:
+            return None
+
+        if verified is None:
+            self.put(key, path)
+
+        return path
+
+    def _stage(self, key: str, record: dict | None) -> bool:
+        with self._lock:
+            entries = self._load()
+
+            if record is None and entries.pop(key, None) is None:
+                return False
+
+            if record is not None:
+                entries[key] = record
+
+            self._pending[key] = record
+
+            if self._since is None:
+                self._since = time.monotonic()
+
+            return (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._since >= self.interval
+            )
+
+    def put(self, key: str, path: Path) -> None:
+        record = {"path": str(path), "sha256": None}
+
+        if path.is_file():
+            stat = path.stat()
+            record.update(size=stat.st_size, mtime=stat.st_mtime_ns)
+
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="kaizo-hf-manifest"
+                    )
+                    atexit.register(self.close)
+
+                self._hashing[key] = self._executor.submit(self._hash, record)
+
+        if self._stage(key, record):
+            self.flush()
+
+    def remove(self, key: str) -> None:
+        if self._stage(key, None):
+            self.flush()
+
+    @staticmethod
+    def _hash(record: dict) -> None:
+        if "size" not in record or record["sha256"] is not None:
+            return
+
+        path = Path(record["path"])
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+
+        if (stat.st_size, stat.st_mtime_ns) == (record["size"], record["mtime"]):
+            record["sha256"] = file_hash(path)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = self._pending
+            futures = [self._hashing.pop(k) for k in pending if k in self._hashing]
+            self._pending = {}
+            self._since = None
+
+        if not pending:
+            return
+
+        wait(futures)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with WeakFileLock(self.path.with_suffix(".lock")):
+            entries = self._read()
+
+            for key, record in pending.items():
+                if record is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = record
+
+            tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entries))
+            tmp.replace(self.path)
+
+        with self._lock:
+            for key, record in self._pending.items():
+                if record is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = record
+
+            self._entries = entries
+
+    def close(self) -> None:
+        self.flush()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+            atexit.unregister(self.close)
@@ -0,0 +1,218 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from huggingface_hub import constants
+from huggingface_hub.utils import get_session, hf_raise_for_status
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+DEFAULT_READ_AHEAD = 2
+DEFAULT_CACHE_BYTES = 1 << 32
+PARTIAL_CONTENT = 206
+
+
+def default_block_cache() -> Path:
+    return Path(constants.HF_HUB_CACHE) / "kaizo" / "blocks"
+
+
+def prune_block_cache(root: Path, max_bytes: int = DEFAULT_CACHE_BYTES) -> int:
+    blocks = []
+
+    for path in Path(root).glob("*/*"):
+        if path.suffix == ".tmp":
+            continue
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+
+        blocks.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(b[1] for b in blocks)
+    removed = 0
+
+    for _, block_size, path in sorted(blocks):
+        if size <= max_bytes:
+            break
+
+        path.unlink(missing_ok=True)
+        size -= block_size
+        removed += 1
+
+    return removed
+
+
+class HFRemoteFile(io.RawIOBase):
+    url: str
+    block_size: int
+    read_ahead: int
+    max_cache_bytes: int = DEFAULT_CACHE_BYTES
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        cache_dir: Path | None = None,
+    ) -> None:
+        super().__init__()
+
+        self.url = url
+        self.block_size = block_size
+        self.read_ahead = read_ahead
+
+        self._headers = dict(headers or {})
+        self._session = get_session()
+        self._position = 0
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+        response = self._session.head(url, headers=self._headers, follow_redirects=True)
+        hf_raise_for_status(response)
+
+        self.size = int(response.headers["Content-Length"])
+
+        etag = response.headers.get("ETag", "")
+        key = hashlib.sha256(f"{url}\n{etag}\n{block_size}".encode()).hexdigest()
+
+        self._cache = Path(cache_dir or default_block_cache()) / key[:32]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+
+        if offset < 0:
+            msg = f"negative seek position {offset}"
+            raise ValueError(msg)
+
+        self._position = offset
+
+        return offset
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+
+        while written < len(view) and self._position < self.size:
+            index, start = divmod(self._position, self.block_size)
+            block = self._block(index)
+            chunk = block[start : start + len(view) - written]
+
+            view[written : written + len(chunk)] = chunk
+            written += len(chunk)
+            self._position += len(chunk)
+
+        return written
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        self._blocks.clear()
+
+        if not self.closed:
+            prune_block_cache(self._cache.parent, self.max_cache_bytes)
+
+        super().close()
+
+    def _read_cached(self, path: Path, length: int) -> bytes | None:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(data) != length:
+            return None
+
+        os.utime(path)
+
+        return data
+
+    def _fetch(self, index: int) -> bytes:
+        path = self._cache / str(index)
+
+        start = index * self.block_size
+        end = min(start + self.block_size, self.size) - 1
+
+        data = self._read_cached(path, end - start + 1)
+
+        if data is not None:
+            return data
+
+        response = self._session.get(
+            self.url,
+            headers={**self._headers, "Range": f"bytes={start}-{end}"},
+            follow_redirects=True,
+        )
+        hf_raise_for_status(response)
+
+        data = response.content
+
+        if response.status_code != PARTIAL_CONTENT and len(data) == self.size:
+            data = data[start : end + 1]
+
+        if len(data) != end - start + 1:
+            msg = (
+                f"expected {end - start + 1} bytes for block {index} of {self.url}, "
+                f"got {len(data)} (status {response.status_code})"
+            )
+            raise OSError(msg)
+
+        self._cache.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+        return data
+
+    def _prefetch(self, index: int) -> None:
+        last = (self.size - 1) // self.block_size
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.read_ahead)
+
+        for i in range(index + 1, min(index + self.read_ahead, last) + 1):
+            if i not in self._blocks and i not in self._pending:
+                self._pending[i] = self._executor.submit(self._fetch, i)
+
+    def _block(self, index: int) -> bytes:
+        with self._lock:
+            if index in self._blocks:
+                self._blocks.move_to_end(index)
+                return self._blocks[index]
+
+            future = self._pending.pop(index, None)
+
+            if self.read_ahead > 0:
+                self._prefetch(index)
+
+        data = future.result() if future is not None else self._fetch(index)
+
+        with self._lock:
+            self._blocks[index] = data
+
+            while len(self._blocks) > self.read_ahead + 1:
+                self._blocks.popitem(last=False)
+
+        return data
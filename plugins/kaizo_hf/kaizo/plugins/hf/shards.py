@@ -0,0 +1,106 @@
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from huggingface_hub import constants
+from huggingface_hub.utils import filter_repo_objects
+
+from .common import HFPatterns
+
+
+@dataclass(frozen=True)
+class HFFile:
+    path: Path
+    name: str
+    size: int
+    mtime: int
+
+
+def list_files(folder_path: Path, patterns: HFPatterns) -> list[HFFile]:
+    folder_path = Path(folder_path)
+    paths = sorted(p for p in folder_path.rglob("*") if p.is_file())
+
+    files = []
+
+    for path in paths:
+        stat = path.stat()
+        files.append(
+            HFFile(
+                path=path,
+                name=path.relative_to(folder_path).as_posix(),
+                size=stat.st_size,
+                mtime=stat.st_mtime_ns,
+            )
+        )
+
+    return list(
+        filter_repo_objects(
+            files,
+            allow_patterns=patterns.allow,
+            ignore_patterns=patterns.ignore,
+            key=lambda f: f.name,
+        )
+    )
+
+
+def split_shards(files: list[HFFile], max_files: int, max_bytes: int) -> list[list[HFFile]]:
+    shards = []
+    shard = []
+    size = 0
+
+    for file in files:
+        if shard and (len(shard) >= max_files or size + file.size > max_bytes):
+            shards.append(shard)
+            shard = []
+            size = 0
+
+        shard.append(file)
+        size += file.size
+
+    if shard:
+        shards.append(shard)
+
+    return shards
+
+
+def default_state_path(*parts: object) -> Path:
+    digest = hashlib.sha256(json.dumps([str(p) for p in parts]).encode()).hexdigest()
+
+    return Path(constants.HF_HUB_CACHE) / "kaizo" / "uploads" / f"{digest[:16]}.json"
+
+
+class HFJournal:
+    path: Path
+    _done: dict[str, list[int]]
+    _lock: threading.Lock
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        try:
+            self._done = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            self._done = {}
+
+    def is_done(self, file: HFFile) -> bool:
+        with self._lock:
+            return self._done.get(file.name) == [file.size, file.mtime]
+
+    def record(self, files: list[HFFile]) -> None:
+        with self._lock:
+            for file in files:
+                self._done[file.name] = [file.size, file.mtime]
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._done))
+            tmp.replace(self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._done = {}
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,90 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+from huggingface_hub import CommitInfo, CommitOperationAdd, CommitOperationDelete
+
+from kaizo.plugins.hf import HFPlugin
+
+
+class FakeApi:
+    def __init__(self, fail_at: int | None = None) -> None:
+        self.fail_at = fail_at
+        self.commits = []
+        self.deletes = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+        time.sleep(0.02)
+
+        with self.lock:
+            self.active -= 1
+
+    def run_as_future(self, fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+
+        return future
+
+    def hf_hub_download(self, *, filename: str, local_dir: Path | None, **kwargs) -> str:
+        self._enter()
+
+        if filename.startswith("missing"):
+            msg = f"{filename} not found"
+            raise FileNotFoundError(msg)
+
+        return str(Path(local_dir or "cache") / filename)
+
+    def preupload_lfs_files(self, repo_id: str, additions: list, **kwargs) -> None:
+        self._enter()
+
+    def create_commit(self, repo_id: str, operations: list, **kwargs) -> CommitInfo:
+        if len(self.commits) == self.fail_at:
+            msg = "rate limited"
+            raise RuntimeError(msg)
+
+        self.commits.append(
+            sorted(
+                op.path_in_repo for op in operations if isinstance(op, CommitOperationAdd)
+            )
+        )
+        self.deletes.append(
+            sorted(
+                op.path_in_repo
+                for op in operations
+                if isinstance(op, CommitOperationDelete)
+            )
+        )
+
+        return CommitInfo(
+            commit_url=f"https://huggingface.co/{repo_id}/commit/{len(self.commits)}",
+            commit_message=kwargs["commit_message"],
+            commit_description="",
+            oid=str(len(self.commits)),
+        )
+
+
+@pytest.fixture
+def make_plugin() -> Iterator[Callable[..., HFPlugin]]:
+    plugins = []
+
+    def make(fail_at: int | None = None) -> HFPlugin:
+        plugin = HFPlugin("hf_test", "user/repo")
+        plugin.api = FakeApi(fail_at)
+        plugins.append(plugin)
+
+        return plugin
+
+    yield make
+
+    for plugin in plugins:
+        plugin.close()
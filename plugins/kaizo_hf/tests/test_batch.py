@@ -0,0 +1,126 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from kaizo.plugins.hf import HFPlugin
+
+FILES = 5
+MAX_FILES = 2
+INTERVAL = 0.1
+
+
+def _files(tmp_path: Path, count: int = FILES) -> list[Path]:
+    paths = []
+
+    for i in range(count):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text("x" * (i + 1))
+        paths.append(path)
+
+    return paths
+
+
+def test_batch_flush(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    plugin.batch(interval=60)
+
+    futures = [plugin.upload_file(path, path.name, batch=True) for path in _files(tmp_path)]
+
+    assert all(isinstance(f, Future) for f in futures)
+    assert plugin.api.commits == []
+
+    plugin.uploads.flush()
+
+    assert len(plugin.api.commits) == 1
+    assert {f.result().oid for f in futures} == {"1"}
+
+    plugin.uploads.close()
+
+
+def test_batch_max_files(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    plugin.batch(max_files=MAX_FILES, interval=60)
+
+    futures = [plugin.upload_file(path, path.name, batch=True) for path in _files(tmp_path)]
+
+    for future in futures[:-1]:
+        future.result(timeout=5)
+
+    assert plugin.api.commits[:2] == [
+        ["file_0.txt", "file_1.txt"],
+        ["file_2.txt", "file_3.txt"],
+    ]
+    assert not futures[-1].done()
+
+    plugin.uploads.close()
+
+    assert futures[-1].result().oid == "3"
+
+
+def test_batch_max_bytes_and_interval(
+    tmp_path: Path, make_plugin: Callable[..., HFPlugin]
+) -> None:
+    plugin = make_plugin()
+    uploads = plugin.batch(max_bytes=3, interval=INTERVAL)
+    first, second, third = _files(tmp_path, 3)
+
+    uploads.submit(first, first.name)
+    uploads.submit(second, second.name).result(timeout=5)
+
+    assert plugin.api.commits == [["file_0.txt", "file_1.txt"]]
+
+    start = time.monotonic()
+    plugin.batch(interval=INTERVAL).submit(third, third.name).result(timeout=5)
+
+    assert time.monotonic() - start >= INTERVAL
+    assert plugin.api.commits[-1] == ["file_2.txt"]
+
+    plugin.uploads.close()
+
+
+def test_batch_errors(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    uploads = plugin.batch(interval=60)
+    (path,) = _files(tmp_path, 1)
+
+    future = uploads.submit(path, path.name)
+    path.unlink()
+    uploads.close()
+
+    with pytest.raises(ValueError, match="path"):
+        future.result()
+
+    with pytest.raises(RuntimeError, match="closed upload batch"):
+        uploads.submit(tmp_path, "dir")
+
+
+def test_batch_created_once(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    paths = _files(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=FILES) as executor:
+        futures = list(
+            executor.map(
+                lambda path: plugin.upload_file(path, path.name, batch=True), paths
+            )
+        )
+
+    plugin.uploads.flush()
+
+    assert all(future.done() for future in futures)
+    assert sorted(name for c in plugin.api.commits for name in c) == [p.name for p in paths]
+
+    plugin.close()
+
+
+def test_batch_rejects_commit(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    (path,) = _files(tmp_path, 1)
+
+    with pytest.raises(ValueError, match="commit cannot be set with batch"):
+        plugin.upload_file(path, path.name, commit={"message": "one"}, batch=True)
+
+    assert plugin.uploads is None
@@ -0,0 +1,79 @@
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+from kaizo.plugins.hf import HFPlugin
+
+FILES = 4
+
+
+def _folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "out"
+    folder.mkdir()
+
+    for i in range(FILES):
+        (folder / f"file_{i}.txt").write_text(str(i))
+
+    return folder
+
+
+def test_incremental_upload(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    folder = _folder(tmp_path)
+    plugin = make_plugin()
+    incremental = {"manifest": tmp_path / "hashes.json", "max_workers": 2}
+
+    plugin.upload_folder(folder, "run", run_as_future=False, incremental=incremental)
+
+    assert plugin.api.commits[0] == [f"run/file_{i}.txt" for i in range(FILES)]
+
+    info = plugin.upload_folder(
+        folder,
+        "run",
+        run_as_future=False,
+        incremental=incremental,
+    )
+
+    assert info is None
+    assert len(plugin.api.commits) == 1
+
+    (folder / "file_0.txt").write_text("changed")
+    (folder / "file_new.txt").write_text("new")
+    os.utime(folder / "file_1.txt")
+    (folder / "file_2.txt").unlink()
+
+    plugin.upload_folder(folder, "run", incremental=incremental).result()
+
+    assert plugin.api.commits[1] == ["run/file_0.txt", "run/file_new.txt"]
+    assert plugin.api.deletes[1] == []
+
+
+def test_incremental_delete_removed(
+    tmp_path: Path, make_plugin: Callable[..., HFPlugin]
+) -> None:
+    folder = _folder(tmp_path)
+    plugin = make_plugin()
+    incremental = {"manifest": tmp_path / "hashes.json", "delete_removed": True}
+
+    plugin.upload_folder(folder, "", run_as_future=False, incremental=incremental)
+    (folder / "file_3.txt").unlink()
+    plugin.upload_folder(folder, "", run_as_future=False, incremental=incremental)
+
+    assert plugin.api.commits[1] == []
+    assert plugin.api.deletes[1] == ["file_3.txt"]
+
+
+def test_incremental_patterns(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    folder = _folder(tmp_path)
+    (folder / "train.log").write_text("log")
+    plugin = make_plugin()
+    incremental = {"manifest": tmp_path / "hashes.json"}
+
+    plugin.upload_folder(
+        folder,
+        "",
+        {"ignore": ["*.log", "file_0.txt"]},
+        run_as_future=False,
+        incremental=incremental,
+    )
+
+    assert plugin.api.commits[0] == ["file_1.txt", "file_2.txt", "file_3.txt"]
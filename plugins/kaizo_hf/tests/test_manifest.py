@@ -0,0 +1,145 @@
+from pathlib import Path
+
+from kaizo.plugins.hf import HFManifest, HFPlugin
+
+PINNED = "0123456789abcdef0123456789abcdef01234567"
+
+
+class FakeApi:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.downloads = []
+
+    def hf_hub_download(self, *, filename: str, **kwargs) -> str:
+        self.downloads.append(filename)
+
+        path = self.root / filename
+        path.write_text(f"content of {filename}")
+
+        return str(path)
+
+    def snapshot_download(self, **kwargs) -> str:
+        self.downloads.append("snapshot")
+
+        return str(self.root)
+
+
+def _plugin(tmp_path: Path, revision: str | None = PINNED, **manifest) -> HFPlugin:
+    plugin = HFPlugin(
+        "hf_test",
+        "user/repo",
+        revision=revision,
+        manifest={"path": tmp_path / "manifest.json", **manifest},
+    )
+    plugin.api = FakeApi(tmp_path)
+
+    return plugin
+
+
+def test_pinned_offline(tmp_path: Path) -> None:
+    plugin = _plugin(tmp_path)
+
+    first = plugin.download_file("a.txt")
+    second = plugin.download_file("a.txt")
+
+    assert first == second
+    assert plugin.api.downloads == ["a.txt"]
+
+    plugin.close()
+    other = _plugin(tmp_path)
+
+    assert other.download_file("a.txt") == first
+    assert other.snapshot_download() == tmp_path
+    assert other.snapshot_download() == tmp_path
+    assert other.api.downloads == ["snapshot"]
+
+
+def test_refresh(tmp_path: Path) -> None:
+    plugin = _plugin(tmp_path)
+
+    plugin.download_file("a.txt")
+    plugin.download_file("a.txt", refresh=True)
+    plugin.download_file("a.txt", force_download=True)
+
+    assert plugin.api.downloads == ["a.txt"] * 3
+
+    refreshing = _plugin(tmp_path, refresh=True)
+    refreshing.download_file("a.txt")
+
+    assert refreshing.api.downloads == ["a.txt"]
+
+
+def test_verify_on_mismatch(tmp_path: Path) -> None:
+    plugin = _plugin(tmp_path)
+
+    path = plugin.download_file("a.txt")
+    path.write_text("corrupted!!!!!!!!!")
+    plugin.download_file("a.txt")
+
+    assert plugin.api.downloads == ["a.txt", "a.txt"]
+
+    path.touch()
+    plugin.download_file("a.txt")
+
+    assert plugin.api.downloads == ["a.txt", "a.txt"]
+
+
+def test_unpinned_revision(tmp_path: Path) -> None:
+    plugin = _plugin(tmp_path, revision="main")
+
+    plugin.download_file("a.txt")
+    plugin.download_file("a.txt")
+
+    assert plugin.api.downloads == ["a.txt", "a.txt"]
+    assert not (tmp_path / "manifest.json").exists()
+
+
+def test_manifest_instance(tmp_path: Path) -> None:
+    manifest = HFManifest(tmp_path / "manifest.json")
+    plugin = HFPlugin("hf_test", "user/repo", revision=PINNED, manifest=manifest)
+
+    assert plugin.manifest is manifest
+
+
+def test_manifest_close(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    plugin = HFPlugin("hf_test", "user/repo", revision=PINNED, manifest={"path": path})
+    (tmp_path / "a.txt").write_text("a")
+
+    plugin.manifest.put("a", tmp_path / "a.txt")
+    plugin.close()
+
+    assert plugin.manifest._executor is None
+    assert HFManifest(path).get("a") == tmp_path / "a.txt"
+
+
+def test_batched_saves_merge(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    first = HFManifest(path, max_pending=2)
+    second = HFManifest(path)
+
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+
+    first.put("a", tmp_path / "a.txt")
+    assert not path.exists()
+
+    second.put("c", tmp_path / "c.txt")
+    second.flush()
+
+    first.put("b", tmp_path / "b.txt")
+
+    assert HFManifest(path).get("a") == tmp_path / "a.txt"
+    assert HFManifest(path).get("c") == tmp_path / "c.txt"
+    assert first.get("c") == tmp_path / "c.txt"
+
+
+def test_refresh_bulk(tmp_path: Path) -> None:
+    plugin = _plugin(tmp_path)
+
+    plugin.download_files(["a.txt"])
+    plugin.download_files(["a.txt"], refresh=True)
+    plugin.snapshot_download()
+    plugin.snapshot_download(refresh=True)
+
+    assert plugin.api.downloads == ["a.txt", "a.txt", "snapshot", "snapshot"]
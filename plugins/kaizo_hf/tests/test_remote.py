@@ -0,0 +1,192 @@
+import io
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from huggingface_hub import HfApi
+
+from kaizo.plugins.hf import HFPlugin
+from kaizo.plugins.hf.remote import prune_block_cache
+
+BLOCK_SIZE = 16
+SIZE = 100
+PARTIAL_CONTENT = 206
+
+FILES = {
+    "data/shard_0.bin": bytes(range(SIZE)),
+    "data/shard_1.bin": bytes(reversed(range(SIZE))),
+    "README.md": b"hello\nworld\n",
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests: list[str] = []
+    ranges: str = "honour"
+
+    def _content(self) -> bytes | None:
+        prefix = "/user/repo/resolve/main/"
+
+        if not self.path.startswith(prefix):
+            return None
+
+        return FILES.get(self.path[len(prefix) :])
+
+    def do_HEAD(self) -> None:
+        content = self._content()
+
+        if content is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        content = self._content()
+
+        if content is None:
+            self.send_error(404)
+            return
+
+        start, end = self.headers["Range"].removeprefix("bytes=").split("-")
+        body = content[int(start) : int(end) + 1]
+        status = PARTIAL_CONTENT
+
+        if self.ranges == "ignore":
+            body, status = content, 200
+        elif self.ranges == "empty":
+            body = b""
+
+        self.requests.append(self.headers["Range"])
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        return
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    Handler.requests = []
+    Handler.ranges = "honour"
+
+    yield f"http://127.0.0.1:{httpd.server_port}"
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FakeApi(HfApi):
+    def list_repo_files(self, repo_id: str, **kwargs) -> list[str]:
+        return list(FILES)
+
+
+def _plugin(endpoint: str) -> HFPlugin:
+    plugin = HFPlugin("hf_test", "user/repo")
+    plugin.api = FakeApi(endpoint=endpoint, token=False)
+
+    return plugin
+
+
+def test_open_file(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+    content = FILES["data/shard_0.bin"]
+
+    with plugin.open_file(
+        "data/shard_0.bin",
+        block_size=BLOCK_SIZE,
+        read_ahead=2,
+        cache_dir=tmp_path,
+    ) as file:
+        assert file.read(4) == content[:4]
+
+        file.seek(50)
+        assert file.read(20) == content[50:70]
+
+        file.seek(-5, io.SEEK_END)
+        assert file.read() == content[-5:]
+
+    first = len(Handler.requests)
+
+    assert first < SIZE // BLOCK_SIZE + 2
+
+    with plugin.open_file(
+        "data/shard_0.bin", block_size=BLOCK_SIZE, cache_dir=tmp_path
+    ) as file:
+        file.seek(50)
+        assert file.read(20) == content[50:70]
+
+    assert len(Handler.requests) == first
+
+
+def test_open_text(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+
+    with plugin.open_file("README.md", "r", cache_dir=tmp_path) as file:
+        assert file.readlines() == ["hello\n", "world\n"]
+
+    with pytest.raises(ValueError, match="unsupported mode"):
+        plugin.open_file("README.md", "wb", cache_dir=tmp_path)
+
+
+def test_iter_files(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+    files = plugin.iter_files("data/*.bin", cache_dir=tmp_path)
+
+    out = {name: file.read(BLOCK_SIZE) for name, file in files}
+
+    assert out == {
+        name: FILES[name][:BLOCK_SIZE] for name in FILES if name.endswith(".bin")
+    }
+
+
+def test_server_ignores_range(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+    content = FILES["data/shard_1.bin"]
+    Handler.ranges = "ignore"
+
+    with plugin.open_file(
+        "data/shard_1.bin", block_size=BLOCK_SIZE, cache_dir=tmp_path
+    ) as file:
+        file.seek(50)
+        assert file.read(20) == content[50:70]
+
+
+def test_short_block_raises(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+    Handler.ranges = "empty"
+
+    file = plugin.open_file(
+        "data/shard_0.bin", block_size=BLOCK_SIZE, read_ahead=0, cache_dir=tmp_path
+    )
+
+    with pytest.raises(OSError, match="expected 16 bytes for block 0"):
+        file.read(4)
+
+    file.close()
+
+
+def test_prune_block_cache(server: str, tmp_path: Path) -> None:
+    plugin = _plugin(server)
+
+    with plugin.open_file(
+        "data/shard_0.bin", block_size=BLOCK_SIZE, cache_dir=tmp_path
+    ) as file:
+        file.read()
+
+    blocks = list(tmp_path.glob("*/*"))
+
+    assert sum(p.stat().st_size for p in blocks) == SIZE
+    assert prune_block_cache(tmp_path, max_bytes=BLOCK_SIZE) == len(blocks) - 1
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*")) <= BLOCK_SIZE
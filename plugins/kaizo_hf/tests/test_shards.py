@@ -0,0 +1,83 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from kaizo.plugins.hf import HFPlugin
+
+FILES = 7
+MAX_FILES = 3
+SHARDS = 3
+
+
+def _folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "out"
+    (folder / "sub").mkdir(parents=True)
+
+    for i in range(FILES):
+        (folder / "sub" / f"file_{i}.bin").write_bytes(bytes(i + 1))
+
+    (folder / "train.log").write_text("log")
+    (folder / ".git").mkdir()
+    (folder / ".git" / "HEAD").write_text("ref: refs/heads/main")
+
+    return folder
+
+
+def test_sharded_upload(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    folder = _folder(tmp_path)
+    plugin = make_plugin()
+
+    infos = plugin.upload_large_folder(
+        folder,
+        "data",
+        patterns={"ignore": "*.log"},
+        shards={"max_files": MAX_FILES, "journal": tmp_path / "journal.json"},
+    )
+
+    assert len(infos) == SHARDS
+    assert [len(c) for c in plugin.api.commits] == [3, 3, 1]
+    assert plugin.api.commits[0][0] == "data/sub/file_0.bin"
+    assert all("train.log" not in name for c in plugin.api.commits for name in c)
+    assert all(".git" not in name for c in plugin.api.commits for name in c)
+    assert plugin.api.peak > 1
+    assert not (tmp_path / "journal.json").exists()
+
+
+def test_sharded_upload_max_bytes(
+    tmp_path: Path, make_plugin: Callable[..., HFPlugin]
+) -> None:
+    folder = _folder(tmp_path)
+    plugin = make_plugin()
+
+    plugin.upload_large_folder(
+        folder,
+        "",
+        patterns={"allow": "sub/*"},
+        shards={"max_bytes": 6, "journal": tmp_path / "journal.json"},
+    )
+
+    assert [len(c) for c in plugin.api.commits] == [3, 1, 1, 1, 1]
+    assert plugin.api.commits[0][0] == "sub/file_0.bin"
+
+
+def test_sharded_upload_resume(
+    tmp_path: Path, make_plugin: Callable[..., HFPlugin]
+) -> None:
+    folder = _folder(tmp_path)
+    shards = {"max_files": MAX_FILES, "journal": tmp_path / "journal.json"}
+
+    plugin = make_plugin(fail_at=1)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        plugin.upload_large_folder(folder, "data", {"ignore": "*.log"}, shards)
+
+    assert len(plugin.api.commits) == 1
+    assert (tmp_path / "journal.json").exists()
+
+    resumed = make_plugin()
+    resumed.upload_large_folder(folder, "data", {"ignore": "*.log"}, shards)
+
+    uploaded = [name for c in resumed.api.commits for name in c]
+
+    assert uploaded == [f"data/sub/file_{i}.bin" for i in range(MAX_FILES, FILES)]
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from pathlib import Path
+
+from kaizo.plugins.hf import HFPlugin
+
+FILES = 20
+WORKERS = 8
+
+
+def test_download_files(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+    names = [f"file_{i}.txt" for i in range(FILES)] + ["missing.txt"]
+
+    out = plugin.download_files(names, {"local": tmp_path}, max_workers=WORKERS)
+
+    assert [t.name for t in out] == names
+    assert all(t.ok for t in out[:-1])
+    assert out[0].path == tmp_path / "file_0.txt"
+    assert isinstance(out[-1].error, FileNotFoundError)
+    assert plugin.api.peak > 1
+
+
+def test_upload_files(tmp_path: Path, make_plugin: Callable[..., HFPlugin]) -> None:
+    plugin = make_plugin()
+
+    files = {}
+
+    for i in range(FILES):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(str(i))
+        files[path] = f"dir/file_{i}.txt"
+
+    files[tmp_path / "missing.txt"] = "dir/missing.txt"
+
+    out = plugin.upload_files(files, max_workers=WORKERS)
+
+    assert [t.name for t in out] == list(files.values())
+    assert all(t.ok for t in out[:-1])
+    assert isinstance(out[-1].error, (FileNotFoundError, ValueError))
+    assert len(plugin.api.commits) == 1
+    assert len(plugin.api.commits[0]) == FILES
+    assert out[0].result.oid == "1"
+    assert plugin.api.peak > 1
@@ -0,0 +1,15 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def plugin_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "plugins.json"
+    plugins = importlib.import_module("kaizo.plugins")
+
+    monkeypatch.setenv("KAIZO_PLUGIN_INDEX", str(path))
+    monkeypatch.setattr(plugins.PluginIndex, "_default", None)
+
+    return path
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from kaizo import ConfigParser
+from kaizo.utils import ArrayEntry
+
+np = pytest.importorskip("numpy")
+
+WEIGHTS = [0.5, 1.5, 2.0]
+LAST = 5
+
+npy_config = """
+weights: !npy weights.npy
+mapped: !mmap weights.npy
+raw: !mmap
+  path: table.bin
+  dtype: int32
+  shape: [2, 3]
+loaded: !npy
+  path: table.bin
+  dtype: int32
+  shape: [2, 3]
+"""
+
+missing_path_config = """
+raw: !mmap
+  dtype: int32
+"""
+
+
+def test_array_tags(tmp_path: Path) -> None:
+    np.save(tmp_path / "weights.npy", np.array(WEIGHTS))
+    np.arange(6, dtype=np.int32).tofile(tmp_path / "table.bin")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(npy_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert isinstance(parser.index[("mapped",)], ArrayEntry)
+
+    weights = out["weights"]
+    mapped = out["mapped"]
+    raw = out["raw"]
+
+    assert weights.tolist() == WEIGHTS
+    assert not isinstance(weights, np.memmap)
+
+    assert mapped.tolist() == WEIGHTS
+    assert isinstance(mapped, np.memmap)
+    assert out["mapped"] is mapped
+
+    assert raw.shape == (2, 3)
+    assert raw[1, 2] == LAST
+
+    loaded = out["loaded"]
+
+    assert not isinstance(loaded, np.memmap)
+    assert loaded.tolist() == raw.tolist()
+
+
+def test_array_missing_path(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(missing_path_config)
+
+    with pytest.raises(yaml.YAMLError, match="path is required for !mmap arrays"):
+        ConfigParser(cfg_file)
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from kaizo import ConfigParser
+from kaizo.utils import FieldEntry, ListEntry
+
+X = 5
+CELL = 6
+
+main_py = """
+def calc(x):
+    return x
+"""
+
+compact_config = f"""
+local: main.py
+table:
+  - [1, 2, 3]
+  - [4, 5, 6]
+lookup:
+  a:
+    b: {X}
+mixed:
+  - 1
+  - .{{lookup.a.b}}
+cell-ref: .{{table.1.2}}
+fn:
+  module: local
+  source: calc
+  args:
+    x: .{{lookup.a}}
+"""
+
+
+def test_literal_subtree_is_compact(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(compact_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    table = parser.index[("table",)]
+
+    assert isinstance(table, FieldEntry)
+    assert table.value == [[1, 2, 3], [4, 5, 6]]
+    assert out["table"] is table.value
+    assert ("table", "0") not in parser.index
+
+    assert out["lookup"] == {"a": {"b": X}}
+
+
+def test_literal_subtree_is_copied(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(compact_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    out["table"][0].append(CELL)
+
+    assert parser.config["table"] == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_non_literal_subtree(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(compact_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    mixed = out["mixed"]
+
+    assert isinstance(mixed, ListEntry)
+    assert list(mixed) == [1, X]
+
+
+def test_reference_into_compact(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(compact_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert out["cell-ref"] == CELL
+    assert out["fn"] == {"b": X}
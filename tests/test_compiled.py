@@ -0,0 +1,87 @@
+import importlib
+import multiprocessing
+import pickle
+from pathlib import Path
+
+from kaizo import CompiledConfig, ConfigParser
+
+X = 5
+Y = 6
+
+main_py = """
+def add(x, y):
+    return x + y
+"""
+
+module_config = f"""
+y: {Y}
+"""
+
+config = f"""
+local: main.py
+import:
+  m: module.yml
+x: {X}
+run:
+  module: local
+  source: add
+  args:
+    x: .{{x}}
+    y: m.{{y}}
+"""
+
+
+def _worker_run(parser: ConfigParser) -> int:
+    return parser.parsed["run"]
+
+
+def test_compile_roundtrip(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    module_file = tmp_path / "module.yml"
+    module_file.write_text(module_config)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    parser.parse()
+
+    compiled = parser.compile()
+
+    assert isinstance(compiled, CompiledConfig)
+    assert compiled.parsed
+    assert set(compiled.imports) == {"m"}
+
+    data = pickle.dumps(compiled)
+
+    cfg_file.unlink()
+    module_file.unlink()
+
+    rebuilt = ConfigParser.from_compiled(pickle.loads(data))  # noqa: S301
+
+    assert rebuilt.parsed["run"] == X + Y
+
+
+def test_pickle_parser_spawn(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    module_file = tmp_path / "module.yml"
+    module_file.write_text(module_config)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    kaizo = importlib.import_module("kaizo")
+
+    parser = kaizo.ConfigParser(cfg_file, frozen=True)
+    parser.parse()
+
+    ctx = multiprocessing.get_context("spawn")
+
+    with ctx.Pool(1) as pool:
+        result = pool.apply(_worker_run, (parser,))
+
+    assert result == X + Y
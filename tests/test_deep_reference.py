@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import Reference, parse_reference
+
+X = 5
+Y = 6
+Z = 7
+
+main_py = """
+def calc(x):
+    return x
+"""
+
+main_config = f"""
+local: main.py
+a:
+  b:
+    c:
+      d: {X}
+    lst:
+      - {Y}
+      - e: {Z}
+fn:
+  module: local
+  source: calc
+  args:
+    x:
+      nested:
+        - {X}
+        - {Y}
+d-ref: .{{a.b.c.d}}
+lst-ref: .{{a.b.lst.1.e}}
+args-ref: .fn.{{x.nested.1}}
+"""
+
+module_config = """
+import:
+  m: main.yml
+d-ref: m.{a.b.c.d}
+args-ref: m.fn.{x.nested.0}
+"""
+
+missing_config = """
+a:
+  b: 1
+bad: .{a.c.d}
+"""
+
+
+def test_parse_reference() -> None:
+    assert parse_reference("plain") is None
+    assert parse_reference("m.key.{a.b}") == Reference("m", "key", "a.b")
+
+    reference = parse_reference(".{a.b.c}")
+
+    assert reference.path("current") == ("a", "b", "c")
+    assert parse_reference(".{}").path("current") == ("current",)
+    assert parse_reference(".key.{}").path("current") == ("key",)
+
+
+def test_local_deep_ref(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(main_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert out["d-ref"] == X
+    assert out["lst-ref"] == Z
+    assert out["args-ref"] == Y
+    assert ("a", "b", "c", "d") in parser.index
+
+
+def test_module_deep_ref(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    main_file = tmp_path / "main.yml"
+    main_file.write_text(main_config)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(module_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert out["d-ref"] == X
+    assert out["args-ref"] == X
+
+
+def test_deep_ref_not_found(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(missing_config)
+
+    parser = ConfigParser(cfg_file)
+
+    with pytest.raises(KeyError, match=r"entry not found, got a.c.d"):
+        parser.parse()
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import DictEntry, FieldEntry, ListEntry
+
+X = 5
+
+main_py = """
+calls = []
+
+def build(x):
+    calls.append(x)
+    return [x]
+"""
+
+config = f"""
+local: main.py
+x: {X}
+lookup:
+  a: [1, 2]
+items:
+  - .{{x}}
+  - 1
+obj:
+  module: local
+  source: build
+  args:
+    x: .{{x}}
+"""
+
+
+def test_freeze_blocks_mutation(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.freeze()
+
+    assert out.frozen
+
+    with pytest.raises(TypeError, match="cannot modify a frozen DictEntry"):
+        out["y"] = FieldEntry(key="y", value=1)
+
+    with pytest.raises(TypeError, match="cannot modify a frozen DictEntry"):
+        del out["x"]
+
+    items = out["items"]
+
+    assert isinstance(items, ListEntry)
+
+    with pytest.raises(TypeError, match="cannot modify a frozen ListEntry"):
+        items.append(FieldEntry(key="items", value=1))
+
+    with pytest.raises(TypeError):
+        out["lookup"]["a"] = ()
+
+    assert out["lookup"]["a"] == (1, 2)
+
+
+def test_frozen_cached_result(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file, frozen=True)
+    out = parser.parse()
+
+    assert out.frozen
+    assert parser.parse() is out
+
+    first = out["obj"]
+
+    assert out["obj"] is first
+    assert parser.local.calls == [X]
+    assert parser.index[("obj",)].result is first
+
+
+def test_frozen_hash() -> None:
+    entry = DictEntry({"a": FieldEntry(key="a", value=1)})
+
+    with pytest.raises(TypeError, match="unhashable type"):
+        hash(entry)
+
+    entry.freeze()
+
+    assert hash(entry) == hash(entry)
+    assert {entry: 1}[entry] == 1
+
+
+def test_frozen_equality() -> None:
+    first = DictEntry({"a": FieldEntry(key="a", value=1)})
+    second = DictEntry({"a": FieldEntry(key="a", value=1)})
+    plain = DictEntry({"a": FieldEntry(key="a", value=1)})
+
+    first.freeze()
+    second.freeze()
+
+    assert first == plain
+    assert plain == second
+    assert first == second
+    assert hash(first) == hash(second)
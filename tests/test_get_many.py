@@ -0,0 +1,128 @@
+import time
+from pathlib import Path
+
+from kaizo import ConfigParser
+from kaizo.utils import dependencies
+
+main_py = """
+import threading
+import time
+
+calls = []
+active = []
+peak = [0]
+lock = threading.Lock()
+
+def slow(name):
+    with lock:
+        active.append(name)
+        peak[0] = max(peak[0], len(active))
+
+    time.sleep(0.1)
+
+    with lock:
+        active.remove(name)
+        calls.append(name)
+
+    return name
+
+def pair(left, right):
+    calls.append((left, right))
+    return (left, right)
+"""
+
+config = """
+local: main.py
+base:
+  module: local
+  source: slow
+  args:
+    name: base
+other:
+  module: local
+  source: slow
+  args:
+    name: other
+a:
+  module: local
+  source: pair
+  args:
+    left: .{base}
+    right: .{other}
+b:
+  module: local
+  source: pair
+  args:
+    left: .{base}
+    right: b
+nested:
+  inner:
+    module: local
+    source: slow
+    args:
+      name: inner
+db:
+  module: sqlite3
+  source: connect
+  args:
+    - ":memory:"
+"""
+
+PARALLEL = 4
+SEQUENTIAL_TIME = 0.3
+
+
+def _parser(tmp_path: Path) -> ConfigParser:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    return ConfigParser(cfg_file)
+
+
+def test_get_many(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+
+    out = parser.get_many(["a", "b", "nested.inner"], parallel=PARALLEL)
+
+    assert out == {
+        "a": ("base", "other"),
+        "b": ("base", "b"),
+        "nested.inner": "inner",
+    }
+    assert parser.local.calls.count("base") == 1
+    assert parser.local.calls.count(("base", "other")) == 1
+    assert parser.parsed["a"] == ("base", "other")
+    assert parser.local.calls.count(("base", "other")) == 1
+
+
+def test_get_many_concurrent(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+
+    start = time.perf_counter()
+    parser.get_many(["a", "nested.inner"], parallel=PARALLEL)
+    elapsed = time.perf_counter() - start
+
+    assert parser.local.peak[0] > 1
+    assert elapsed < SEQUENTIAL_TIME
+
+
+def test_get_many_sequential_keeps_thread(tmp_path: Path) -> None:
+    out = _parser(tmp_path).get_many(["a", "db"])
+
+    assert out["a"] == ("base", "other")
+    assert out["db"].execute("select 1").fetchone() == (1,)
+
+
+def test_dependencies(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+    parser.parse()
+
+    deps = dependencies(parser.get_entry("a"))
+
+    assert {id(d) for d in deps} == {
+        id(parser.get_entry("base")),
+        id(parser.get_entry("other")),
+    }
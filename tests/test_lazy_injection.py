@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 from kaizo import ConfigParser
@@ -44,3 +45,20 @@ def test_lazy_injection(tmp_path: Path) -> None:
 
     assert isinstance(out["a"], FnWithKwargs)
     assert out["b"] == (X, Y, Z)
+
+
+def test_lazy_pickle(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(lazy_config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    fn = pickle.loads(pickle.dumps(out["a"]))  # noqa: S301
+    entry = pickle.loads(pickle.dumps(parser.get_entry("b")))  # noqa: S301
+
+    assert fn(X, Y) == (X, Y, Z)
+    assert entry.__call__() == (X, Y, Z)
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 from kaizo import ConfigParser
@@ -58,3 +59,20 @@ def test_absolute_local_module(tmp_path: Path) -> None:
     out = parser.parse()
 
     assert out["run"] == RESULT
+
+
+def test_local_module_unloaded_on_close(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(relative_config)
+
+    parser = ConfigParser(cfg_file)
+    name = parser.local.__name__
+
+    assert sys.modules[name] is parser.local
+
+    parser.close()
+
+    assert name not in sys.modules
@@ -0,0 +1,138 @@
+import types
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+
+main_py = """
+import threading
+import time
+
+threads = set()
+
+def square(x, offset=0):
+    threads.add(threading.get_ident())
+    time.sleep(0.01 * (x % 3))
+    return x * x + offset
+
+def numbers(n):
+    return range(n)
+"""
+
+config = """
+local: main.py
+nums:
+  module: local
+  source: numbers
+  args:
+    n: 10
+squares:
+  module: local
+  source: square
+  args:
+    x: .{nums}
+    offset: 1
+  map:
+    over: x
+    workers: 4
+    chunksize: 2
+unordered:
+  module: local
+  source: square
+  args:
+    x: .{nums}
+  map:
+    over: x
+    ordered: false
+streamed:
+  module: local
+  source: square
+  args:
+    x: .{nums}
+  map:
+    over: x
+    stream: true
+short:
+  module: local
+  source: square
+  args:
+    x: [1, 2, 3]
+  map: x
+negated:
+  module: operator
+  source: neg
+  args:
+    - [1, 2, 3]
+  map:
+    over: 0
+    pool: process
+    workers: 2
+processed:
+  module: local
+  source: square
+  args:
+    x: [1, 2, 3]
+    offset: 1
+  map:
+    over: x
+    pool: process
+    workers: 2
+"""
+
+bad_config = """
+local: main.py
+bad:
+  module: local
+  source: square
+  args:
+    x: 1
+  map: y
+"""
+
+SIZE = 10
+
+
+def _parser(tmp_path: Path, text: str = config) -> ConfigParser:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(text)
+
+    return ConfigParser(cfg_file)
+
+
+def test_map(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+    out = parser.parse()
+
+    assert out["squares"] == [x * x + 1 for x in range(SIZE)]
+    assert out["squares"] is out["squares"]
+    assert len(parser.local.threads) > 1
+    assert sorted(out["unordered"]) == [x * x for x in range(SIZE)]
+    assert out["short"] == [1, 4, 9]
+
+
+def test_map_stream(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    first = out["streamed"]
+    second = out["streamed"]
+
+    assert isinstance(first, types.GeneratorType)
+    assert first is not second
+    assert list(first) == [x * x for x in range(SIZE)]
+    assert list(second) == [x * x for x in range(SIZE)]
+
+
+def test_map_process_pool(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert out["negated"] == [-1, -2, -3]
+    assert out["processed"] == [2, 5, 10]
+
+
+def test_map_missing_arg(tmp_path: Path) -> None:
+    with pytest.raises(KeyError, match="map argument 'y' not found"):
+        _parser(tmp_path, bad_config).parse()
@@ -0,0 +1,87 @@
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from kaizo import ConfigParser
+
+X = 5
+Y = 6
+
+main_py = """
+class Model:
+    def __init__(self, size):
+        self.size = size
+"""
+
+config = f"""
+local: main.py
+x: {X}
+nested:
+  values:
+    - .{{x}}
+    - {Y}
+  model:
+    module: local
+    source: Model
+    args:
+      size: .{{x}}
+lookup:
+  a: [1, 2]
+"""
+
+
+def test_materialize_all(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.materialize()
+
+    assert type(out["nested"]) is dict
+    assert out["nested"]["values"] == [X, Y]
+    assert out["nested"]["model"].size == X
+    assert out["lookup"] == {"a": [1, 2]}
+
+    out["lookup"]["a"].append(3)
+
+    assert parser.materialize(["lookup"])["lookup"] == {"a": [1, 2]}
+
+
+def test_materialize_keys(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    parser.parse()
+
+    out = parser.materialize(["x", "nested.values", "lookup.a.1"])
+
+    assert out == {"x": X, "nested.values": [X, Y], "lookup.a.1": 2}
+
+    with pytest.raises(KeyError, match="entry not found, got missing"):
+        parser.materialize(["missing"])
+
+
+def test_materialize_readonly(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    out = parser.materialize(readonly=True)
+
+    assert isinstance(out, MappingProxyType)
+    assert isinstance(out["nested"], MappingProxyType)
+    assert out["nested"]["values"] == (X, Y)
+
+    with pytest.raises(TypeError):
+        out["lookup"]["a"] = ()
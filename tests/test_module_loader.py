@@ -0,0 +1,82 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import ModuleLoader
+
+VAL = 16
+
+main_py = """
+class Calc:
+    @staticmethod
+    def sqrt(x):
+        return x ** 0.5
+"""
+
+dotted_config = f"""
+fn:
+  module: pathlib
+  source: Path.cwd
+local_fn:
+  module: local
+  source: Calc.sqrt
+  args:
+    - {VAL}
+"""
+
+
+def test_load_object_cached() -> None:
+    ModuleLoader.clear_cache()
+
+    first = ModuleLoader.load_object("math", "sqrt")
+    second = ModuleLoader.load_object("math", "sqrt")
+
+    assert first is second
+    assert ("math", "sqrt") in ModuleLoader._resolved
+
+
+def test_load_object_negative_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    ModuleLoader.clear_cache()
+
+    with pytest.raises(AttributeError):
+        ModuleLoader.load_object("math", "bad_attribute")
+
+    calls = []
+    monkeypatch.setattr(importlib, "import_module", calls.append)
+
+    with pytest.raises(AttributeError, match="has no attribute 'bad_attribute'"):
+        ModuleLoader.load_object("math", "bad_attribute")
+
+    assert calls == []
+
+    monkeypatch.undo()
+    ModuleLoader.clear_cache()
+
+    assert ModuleLoader.load_object("math", "sqrt")(VAL) == VAL**0.5
+
+
+def test_load_object_dotted() -> None:
+    ModuleLoader.clear_cache()
+
+    obj = ModuleLoader.load_object("pathlib", "Path.cwd")
+
+    assert obj == Path.cwd
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        ModuleLoader.load_object("pathlib", "Path.missing")
+
+
+def test_dotted_source(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(f"local: main.py\n{dotted_config}")
+
+    parser = ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert out["fn"] == Path.cwd()
+    assert out["local_fn"] == VAL**0.5
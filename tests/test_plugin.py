@@ -97,3 +97,20 @@ def test_using_plugin(tmp_path: Path) -> None:
     entry = out["fn"]
 
     assert entry == VAL**0.5
+
+
+def test_plugin_args_namespace(tmp_path: Path) -> None:
+    create_fake_plugin(tmp_path, "dummy", body=plugin_with_args_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(f"{plugin_with_args_config}dummy:\n  x: {VAL}\nz: .{{dummy.x}}\n")
+
+    parser = kaizo.ConfigParser(cfg_file, frozen=True)
+    out = parser.parse()
+
+    plugin = parser.plugins["dummy"]()
+
+    assert plugin.x == X
+    assert out["z"] == VAL
+    assert parser.get_entry("dummy.x").__call__() == VAL
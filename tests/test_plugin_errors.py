@@ -70,7 +70,7 @@ def test_plugin_missing_module(tmp_path: Path) -> None:
     cfg_file.write_text(missing_config)
 
     with pytest.raises(ImportError):
-        kaizo.ConfigParser(cfg_file)
+        kaizo.ConfigParser(cfg_file).validate()
 
 
 def test_plugin_invalid_type(tmp_path: Path) -> None:
@@ -101,7 +101,7 @@ def test_plugin_missing_source_attr(tmp_path: Path) -> None:
     cfg_file.write_text(bad_plugin_config)
 
     with pytest.raises(AttributeError):
-        kaizo.ConfigParser(cfg_file)
+        kaizo.ConfigParser(cfg_file).validate()
 
 
 def test_plugin_invalid_module(tmp_path: Path) -> None:
@@ -122,7 +122,7 @@ def test_plugin_not_subclass(tmp_path: Path) -> None:
     cfg_file.write_text(wrong_plugin_config)
 
     with pytest.raises(TypeError):
-        kaizo.ConfigParser(cfg_file)
+        kaizo.ConfigParser(cfg_file).validate()
 
 
 def test_using_invalid_plugin(tmp_path: Path) -> None:
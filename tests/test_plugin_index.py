@@ -0,0 +1,100 @@
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+VAL = 5
+
+entry_point_config = f"""
+plugins:
+  fake: MyPlugin
+fn:
+  module: plugin
+  source: fake
+  call: value
+  args:
+    - {VAL}
+"""
+fake_plugin_py = """
+from kaizo import Plugin
+
+class MyPlugin(Plugin):
+    def value(self, x):
+        return x
+"""
+
+
+def create_fake_dist(site: Path, name: str, plugin: str, module: str) -> None:
+    dist_info = site / f"{name}-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(f"[kaizo.plugins]\n{plugin} = {module}\n")
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site = tmp_path / "site"
+    site.mkdir()
+
+    (site / "fake_kaizo_plugin.py").write_text(fake_plugin_py)
+    create_fake_dist(site, "fakedist", "fake", "fake_kaizo_plugin")
+
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setenv("KAIZO_PLUGIN_INDEX", str(tmp_path / "index.json"))
+
+    return site
+
+
+@pytest.mark.usefixtures("site")
+def test_entry_point_plugin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    kaizo = importlib.import_module("kaizo")
+    monkeypatch.setattr(kaizo.plugins.PluginIndex, "_default", None)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(entry_point_config)
+
+    parser = kaizo.ConfigParser(cfg_file)
+
+    assert parser.parse()["fn"] == VAL
+    assert "fake" in (tmp_path / "index.json").read_text()
+
+
+def test_index_refreshed_on_change(
+    tmp_path: Path, site: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugins = importlib.import_module("kaizo.plugins")
+
+    calls = []
+    discover = plugins.PluginIndex.discover
+
+    def counting() -> dict[str, str]:
+        calls.append(1)
+        return discover()
+
+    monkeypatch.setattr(plugins.PluginIndex, "discover", staticmethod(counting))
+
+    path = tmp_path / "index.json"
+
+    assert plugins.PluginIndex(path).module("fake") == "fake_kaizo_plugin"
+    assert plugins.PluginIndex(path).module("fake") == "fake_kaizo_plugin"
+    assert len(calls) == 1
+
+    create_fake_dist(site, "otherdist", "other", "other_kaizo_plugin")
+    stat = site.stat()
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert plugins.PluginIndex(path).module("other") == "other_kaizo_plugin"
+    assert calls == [1, 1]
+
+
+@pytest.mark.usefixtures("site")
+def test_namespace_fallback(tmp_path: Path) -> None:
+    plugins = importlib.import_module("kaizo.plugins")
+
+    index = plugins.PluginIndex(tmp_path / "index.json")
+
+    assert index.module("missing") == "kaizo.plugins.missing"
@@ -0,0 +1,100 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from .common import create_fake_plugin
+
+VAL = 9
+ROOT = 3
+
+lazy_plugin_config = f"""
+plugins:
+  lazy: MyPlugin
+  missing: MyPlugin
+value: {VAL}
+fn:
+  module: plugin
+  source: lazy
+  call: sqrt
+  args:
+    - .{{value}}
+"""
+lazy_plugin_py = """
+import math
+from kaizo import Plugin
+
+class MyPlugin(Plugin):
+    def sqrt(self, num):
+        return math.sqrt(num)
+"""
+
+bad_call_config = """
+plugins:
+  lazy: MyPlugin
+fn:
+  module: plugin
+  source: lazy
+  call: missing
+"""
+
+
+def test_plugin_imported_on_access(tmp_path: Path) -> None:
+    create_fake_plugin(tmp_path, "lazy", body=lazy_plugin_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(lazy_plugin_config)
+
+    parser = kaizo.ConfigParser(cfg_file)
+    out = parser.parse()
+
+    assert "kaizo.plugins.lazy" not in sys.modules
+    assert not parser.plugins["lazy"].loaded
+    assert out["value"] == VAL
+
+    assert out["fn"] == ROOT
+    assert "kaizo.plugins.lazy" in sys.modules
+    assert parser.plugins["lazy"].loaded
+    assert not parser.plugins["missing"].loaded
+
+
+def test_validate_fails_fast(tmp_path: Path) -> None:
+    create_fake_plugin(tmp_path, "lazy", body=lazy_plugin_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(lazy_plugin_config)
+
+    parser = kaizo.ConfigParser(cfg_file)
+
+    with pytest.raises(ImportError):
+        parser.validate()
+
+
+def test_missing_call_raised_on_access(tmp_path: Path) -> None:
+    create_fake_plugin(tmp_path, "lazy", body=lazy_plugin_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(bad_call_config)
+
+    parser = kaizo.ConfigParser(cfg_file)
+    out = parser.parse()
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        out["fn"]
+
+
+def test_validate_checks_call(tmp_path: Path) -> None:
+    create_fake_plugin(tmp_path, "lazy", body=lazy_plugin_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(bad_call_config)
+
+    parser = kaizo.ConfigParser(cfg_file)
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        parser.validate()
@@ -0,0 +1,162 @@
+import gc
+import importlib
+import threading
+from pathlib import Path
+
+from .common import create_fake_plugin
+
+plugin_py = """
+import itertools
+from kaizo import Plugin
+
+counter = itertools.count()
+closed = []
+
+class MyPlugin(Plugin):
+    def __init__(self, name="default"):
+        self.name = name
+        self.id = next(counter)
+
+    def ident(self):
+        return self.id
+
+    def close(self):
+        closed.append(self.id)
+"""
+
+config = """
+plugins:
+  scoped:
+    source: MyPlugin
+    args:
+      name: {scope}
+    scope: {scope}
+first:
+  module: plugin
+  source: scoped
+  call: ident
+second:
+  module: plugin
+  source: scoped
+  call: ident
+instance:
+  module: plugin
+  source: scoped
+  call: false
+"""
+
+THREADS = 4
+
+
+def _parser(tmp_path: Path, scope: str) -> object:
+    create_fake_plugin(tmp_path, "scoped", body=plugin_py)
+    kaizo = importlib.import_module("kaizo")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config.format(scope=scope))
+
+    return kaizo.ConfigParser(cfg_file)
+
+
+def test_parser_scope(tmp_path: Path) -> None:
+    parser = _parser(tmp_path, "parser")
+    out = parser.parse()
+
+    assert out["first"] == out["second"]
+
+    factory = parser.plugins["scoped"]
+    plugin = factory()
+
+    assert plugin is factory()
+    assert plugin.name == "parser"
+
+    parser.close()
+
+    module = importlib.import_module("kaizo.plugins.scoped")
+
+    assert module.closed == [plugin.id]
+    assert factory() is not plugin
+
+
+def test_thread_scope(tmp_path: Path) -> None:
+    parser = _parser(tmp_path, "thread")
+    factory = parser.plugins["scoped"]
+
+    plugins = []
+
+    def run() -> None:
+        plugins.append((factory(), factory()))
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(a is b for a, b in plugins)
+    assert len({id(a) for a, _ in plugins}) == THREADS
+
+    parser.close()
+
+    module = importlib.import_module("kaizo.plugins.scoped")
+
+    assert sorted(module.closed) == sorted(a.id for a, _ in plugins)
+
+
+def test_thread_scope_drops_finished_threads(tmp_path: Path) -> None:
+    parser = _parser(tmp_path, "thread")
+    factory = parser.plugins["scoped"]
+
+    plugins = []
+    thread = threading.Thread(target=lambda: plugins.append(factory()))
+    thread.start()
+    thread.join()
+
+    del thread
+    gc.collect()
+
+    module = importlib.import_module("kaizo.plugins.scoped")
+
+    assert factory.thread_instances == {}
+    assert module.closed == [plugins[0].id]
+
+    parser.close()
+
+
+def test_thread_scope_entry_after_warmup(tmp_path: Path) -> None:
+    parser = _parser(tmp_path, "thread")
+    parser.warmup(["instance"], parallel=2, check_fork=False)
+    gc.collect()
+
+    plugins = []
+
+    def run() -> None:
+        entry = parser.get_entry("instance")
+        plugins.append((entry.__call__(), entry.__call__()))
+
+    threads = [threading.Thread(target=run) for _ in range(2)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    module = importlib.import_module("kaizo.plugins.scoped")
+    (first, again), (second, _) = plugins
+
+    assert first is again
+    assert first is not second
+    assert first.id not in module.closed
+    assert second.id not in module.closed
+
+    parser.close()
+
+
+def test_call_scope(tmp_path: Path) -> None:
+    parser = _parser(tmp_path, "call")
+    factory = parser.plugins["scoped"]
+
+    assert factory() is not factory()
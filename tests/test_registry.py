@@ -0,0 +1,165 @@
+import gc
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import ParserRegistry, approx_size
+
+SIZE = 100_000
+MAX_BYTES = 1_000
+DEPTH = 100_000
+
+module_config = f"""
+isolated: false
+data:
+  module: builtins
+  source: bytes
+  args:
+    - {SIZE}
+"""
+
+m_config = """
+import:
+  m: module.yml
+run: m.{data}
+"""
+
+n_config = """
+import:
+  n: module.yml
+run: n.{data}
+"""
+
+
+def write_configs(tmp_path: Path) -> tuple[Path, Path]:
+    (tmp_path / "module.yml").write_text(module_config)
+
+    m_file = tmp_path / "m.yml"
+    m_file.write_text(m_config)
+
+    n_file = tmp_path / "n.yml"
+    n_file.write_text(n_config)
+
+    return m_file, n_file
+
+
+def use_registry(monkeypatch: pytest.MonkeyPatch, **kwargs) -> ParserRegistry:
+    registry = ParserRegistry(**kwargs)
+    monkeypatch.setattr(ConfigParser, "shared_modules", registry)
+
+    return registry
+
+
+def refs(registry: ParserRegistry) -> dict[str, int]:
+    return {m.key: m.refs for m in registry.stats().modules}
+
+
+def test_shared_module_refcount(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = use_registry(monkeypatch)
+    m_file, _ = write_configs(tmp_path)
+
+    first = ConfigParser(m_file)
+    second = ConfigParser(m_file)
+
+    assert refs(registry) == {"m": 2}
+    assert len(first.parse()["run"]) == SIZE
+
+    first.close()
+    assert refs(registry) == {"m": 1}
+
+    second.close()
+    assert refs(registry) == {"m": 0}
+    assert "m" in registry
+
+
+def test_lru_eviction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = use_registry(monkeypatch, max_modules=1)
+    m_file, n_file = write_configs(tmp_path)
+
+    ConfigParser(m_file).close()
+    parser = ConfigParser(n_file)
+
+    assert "m" not in registry
+    assert refs(registry) == {"n": 1}
+    assert registry.stats().evictions == 1
+
+    parser.close()
+
+
+def test_referenced_modules_are_kept(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registry = use_registry(monkeypatch, max_modules=1)
+    m_file, n_file = write_configs(tmp_path)
+
+    first = ConfigParser(m_file)
+    second = ConfigParser(n_file)
+
+    assert refs(registry) == {"m": 1, "n": 1}
+
+    first.close()
+
+    assert refs(registry) == {"n": 1}
+
+    second.close()
+
+
+def test_memory_stats_and_budget(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = use_registry(monkeypatch, max_bytes=MAX_BYTES)
+    m_file, _ = write_configs(tmp_path)
+
+    parser = ConfigParser(m_file)
+    parser.parse()["run"]
+
+    assert registry.stats().size >= SIZE
+
+    parser.close()
+
+    assert "m" not in registry
+    assert registry.stats().size == 0
+
+
+def test_release_on_collect(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = use_registry(monkeypatch)
+    m_file, _ = write_configs(tmp_path)
+
+    parser = ConfigParser(m_file)
+    assert refs(registry) == {"m": 1}
+
+    del parser
+    gc.collect()
+
+    assert refs(registry) == {"m": 0}
+
+
+class Measured:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def memory_usage(self) -> int:
+        self.calls += 1
+        return 1
+
+    def close(self) -> None:
+        return
+
+
+def test_sizes_are_cached() -> None:
+    registry = ParserRegistry(max_bytes=MAX_BYTES)
+    first, second = Measured(), Measured()
+
+    registry.acquire("first", first)
+    registry.acquire("second", second)
+    registry.release(["first"])
+
+    assert (first.calls, second.calls) == (2, 1)
+
+
+def test_approx_size_deep_nesting() -> None:
+    nested = []
+
+    for _ in range(DEPTH):
+        nested = [nested]
+
+    assert approx_size(nested) >= DEPTH
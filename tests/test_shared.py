@@ -0,0 +1,107 @@
+import gc
+import importlib
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import SharedBackend, SharedBlock
+from kaizo.utils.shared import _attached
+
+np = pytest.importorskip("numpy")
+
+SIZE = 12
+PAYLOAD = b"kaizo-shared"
+
+main_py = f"""
+import numpy as np
+
+def table():
+    return np.arange({SIZE}, dtype=np.float32).reshape(3, 4)
+
+def blob():
+    return {PAYLOAD!r}
+"""
+
+config = """
+local: main.py
+table:
+  module: local
+  source: table
+blob:
+  module: local
+  source: blob
+value: 1
+"""
+
+
+def _worker_sum(blocks: dict[str, SharedBlock]) -> float:
+    values = ConfigParser.attach(blocks)
+
+    return float(values["table"].sum())
+
+
+def test_share_shm(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    kaizo = importlib.import_module("kaizo")
+
+    parser = kaizo.ConfigParser(cfg_file)
+    blocks = parser.share(["table", "blob"])
+
+    ctx = multiprocessing.get_context("spawn")
+
+    with ctx.Pool(1) as pool:
+        total = pool.apply(_worker_sum, (blocks,))
+
+    assert total == sum(range(SIZE))
+
+    attached = ConfigParser.attach(blocks)
+
+    assert bytes(attached["blob"]) == PAYLOAD
+    assert not attached["table"].flags.writeable
+
+    parser.release_shared()
+
+
+def test_share_file(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    blocks = parser.share(["table"], backend=SharedBackend.FILE)
+
+    assert Path(blocks["table"].name).is_file()
+
+    table = ConfigParser.attach(blocks)["table"]
+
+    assert table.shape == (3, 4)
+    assert table[2, 3] == SIZE - 1
+    assert ConfigParser.attach(blocks)["table"] is table
+
+    del table
+    gc.collect()
+
+    assert blocks["table"].name not in _attached
+
+    parser.release_shared()
+
+    assert not Path(blocks["table"].name).exists()
+
+
+def test_share_invalid(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text("value: 1\n")
+
+    parser = ConfigParser(cfg_file)
+
+    with pytest.raises(TypeError, match="only arrays and bytes can be shared"):
+        parser.share(["value"])
@@ -0,0 +1,165 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import Stream, prefetch
+
+main_py = """
+calls = []
+
+def lines(n):
+    calls.append(n)
+    for i in range(n):
+        yield f"line {i}"
+
+def upper(items):
+    for item in items:
+        yield item.upper()
+
+def take(items, n):
+    for i, item in enumerate(items):
+        if i >= n:
+            return
+        yield item
+
+def fail(items):
+    yield from items
+    raise RuntimeError("stage failed")
+"""
+
+config = """
+local: main.py
+source:
+  module: local
+  source: lines
+  stream: true
+  args:
+    n: 5
+piped:
+  pipe:
+    - .{source}
+    - module: local
+      source: upper
+    - module: local
+      source: take
+      args:
+        n: 3
+prefetched:
+  pipe:
+    - .{source}
+    - module: local
+      source: upper
+  prefetch: 2
+literal:
+  pipe:
+    - [a, b]
+    - module: local
+      source: upper
+failing:
+  pipe:
+    - .{source}
+    - module: local
+      source: fail
+  prefetch: 1
+generator:
+  module: local
+  source: lines
+  args:
+    n: 2
+generated:
+  pipe:
+    - module: local
+      source: lines
+      args:
+        n: 2
+    - module: local
+      source: upper
+one_shot:
+  pipe:
+    - .{generator}
+    - module: local
+      source: upper
+shell:
+  pipe: "|"
+  sep: ","
+"""
+
+SIZE = 5
+PREFETCH = 2
+
+
+def _parser(tmp_path: Path) -> ConfigParser:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    return ConfigParser(cfg_file)
+
+
+def test_stream_entry(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+    out = parser.parse()
+
+    stream = out["source"]
+
+    assert isinstance(stream, Stream)
+    assert stream is out["source"]
+    assert parser.local.calls == []
+    assert list(stream) == [f"line {i}" for i in range(SIZE)]
+    assert list(stream) == [f"line {i}" for i in range(SIZE)]
+    assert parser.local.calls == [SIZE, SIZE]
+
+
+def test_pipe(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert list(out["piped"]) == ["LINE 0", "LINE 1", "LINE 2"]
+    assert list(out["piped"]) == ["LINE 0", "LINE 1", "LINE 2"]
+    assert list(out["prefetched"]) == [f"LINE {i}" for i in range(SIZE)]
+    assert list(out["literal"]) == ["A", "B"]
+
+
+def test_pipe_iterates_twice(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert list(out["generated"]) == ["LINE 0", "LINE 1"]
+    assert list(out["generated"]) == ["LINE 0", "LINE 1"]
+
+    with pytest.raises(TypeError, match="one-shot iterator"):
+        list(out["one_shot"])
+
+
+def test_plain_dict_with_pipe_key(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert dict(out["shell"]) == {"pipe": "|", "sep": ","}
+
+
+def test_pipe_error(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        list(out["failing"])
+
+
+def test_prefetch_bounded() -> None:
+    produced = []
+
+    def source() -> object:
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch(source(), PREFETCH)
+
+    assert next(iterator) == 0
+
+    time.sleep(0.2)
+
+    assert len(produced) <= PREFETCH + 2
+
+    iterator.close()
@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+
+LR = 0.1
+BOUND_LR = 0.5
+BATCH = 4
+BOUND_BATCH = 8
+
+helpers_py = """
+count = 0
+
+def build(tag, **kwargs):
+    global count
+    count += 1
+
+    return {"tag": tag, **kwargs}
+"""
+
+template_config = f"""
+local: helpers.py
+lr: {LR}
+name: base
+encoder:
+  module: local
+  source: build
+  args:
+    tag: .{{name}}
+model:
+  module: local
+  source: build
+  args:
+    tag: .{{lr}}
+    encoder: .{{encoder}}
+head:
+  module: local
+  source: build
+  args:
+    tag: .{{model}}
+loader:
+  module: local
+  source: build
+  args:
+    tag: .{{batch}}
+"""
+
+
+@pytest.fixture
+def parser(tmp_path: Path) -> ConfigParser:
+    (tmp_path / "helpers.py").write_text(helpers_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(template_config)
+
+    return ConfigParser(cfg_file, kwargs={"batch": BATCH})
+
+
+def test_bind_rebuilds_dependents_only(parser: ConfigParser) -> None:
+    template = parser.template()
+    parser.materialize()
+    built = parser.local.count
+
+    bound = template.bind({"lr": BOUND_LR})
+    model = bound.get_entry("model").__call__()
+    bound.materialize()
+
+    assert template.dependents({"lr"}) == ["lr", "model", "head"]
+    assert parser.local.count == built + 2
+
+    assert model["tag"] == BOUND_LR
+    assert model["encoder"] is parser.get_entry("encoder").__call__()
+    assert bound.get_entry("head").__call__()["tag"] is model
+    assert bound.get_entry("encoder") is parser.get_entry("encoder")
+    assert bound.get_entry("loader") is parser.get_entry("loader")
+
+    assert parser.materialize()["model"]["tag"] == LR
+
+
+def test_bind_transitive(parser: ConfigParser) -> None:
+    template = parser.template()
+
+    bound = template.bind({"name": "other"})
+
+    assert template.dependents({"name"}) == ["name", "encoder", "model", "head"]
+    assert bound.materialize()["head"]["tag"]["encoder"]["tag"] == "other"
+    assert bound.get_entry("lr") is parser.get_entry("lr")
+
+
+def test_bind_runtime_kwargs(parser: ConfigParser) -> None:
+    template = parser.template()
+
+    bound = template.bind({"batch": BOUND_BATCH})
+
+    assert template.dependents({"batch"}) == ["loader"]
+    assert bound.materialize()["loader"]["tag"] == BOUND_BATCH
+    assert parser.materialize()["loader"]["tag"] == BATCH
+    assert bound.compile().kwargs == {"batch": BOUND_BATCH}
+
+
+def test_bind_without_kwargs_shares_everything(parser: ConfigParser) -> None:
+    bound = parser.template().bind()
+
+    for key in parser.parsed:
+        assert bound.get_entry(key) is parser.get_entry(key)
+
+    bound.close()
+
+
+def test_bind_args_reference(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(
+        "cfg:\n  a: 1\nmodel:\n  module: builtins\n  source: dict\n  args: .{cfg}\n"
+    )
+
+    template = ConfigParser(cfg_file).template()
+    bound = template.bind({"cfg": {"a": 2}})
+
+    assert template.dependents({"cfg"}) == ["cfg", "model"]
+    assert bound.materialize()["model"] == {"a": 2}
+
+
+def test_bound_freeze_keeps_template(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text("lr: 0.1\nlookup: [1, 2]\n")
+
+    parser = ConfigParser(cfg_file)
+    bound = parser.template().bind({"lr": BOUND_LR})
+    bound.freeze()
+
+    assert bound.parsed["lookup"] == (1, 2)
+    assert parser.parsed["lookup"] == [1, 2]
+    assert not parser.frozen
+
+
+def test_bind_imported_module(tmp_path: Path) -> None:
+    (tmp_path / "module.yml").write_text("model:\n  lr: .{lr}\n")
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text("import:\n  m: module.yml\ntop: m.{model}\nother: 1\n")
+
+    parser = ConfigParser(cfg_file, kwargs={"lr": LR})
+    template = parser.template()
+    bound = template.bind({"lr": BOUND_LR})
+
+    assert template.dependents({"lr"}) == ["top"]
+    assert bound.materialize()["top"] == {"lr": BOUND_LR}
+    assert parser.materialize()["top"] == {"lr": LR}
+    assert bound.get_entry("other") is parser.get_entry("other")
+
+    bound.close()
+    parser.close()
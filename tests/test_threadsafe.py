@@ -0,0 +1,122 @@
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.utils import DictEntry, FieldEntry
+
+THREADS = 16
+ROUNDS = 200
+KEYS = 20
+
+helpers_py = """
+import threading
+import time
+
+count = 0
+lock = threading.Lock()
+
+def build():
+    global count
+
+    with lock:
+        count += 1
+
+    time.sleep(0.01)
+
+    return object()
+"""
+
+keys_config = "\n".join(f"k{i}: {i}" for i in range(KEYS))
+
+threadsafe_config = f"""
+local: helpers.py
+model:
+  module: local
+  source: build
+{keys_config}
+"""
+
+
+@contextmanager
+def contention() -> Iterator[None]:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def run_all(fn: Callable[[int], object], threads: int = THREADS) -> list:
+    barrier = threading.Barrier(threads)
+
+    def worker(i: int) -> object:
+        barrier.wait()
+        return fn(i)
+
+    with contention(), ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(worker, range(threads)))
+
+
+@pytest.fixture
+def parser(tmp_path: Path) -> ConfigParser:
+    (tmp_path / "helpers.py").write_text(helpers_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(threadsafe_config)
+
+    return ConfigParser(cfg_file)
+
+
+def test_concurrent_first_access_builds_once(parser: ConfigParser) -> None:
+    results = run_all(lambda _: parser.get_entry("model").__call__())
+
+    assert parser.local.count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_reads_during_reparse(parser: ConfigParser) -> None:
+    parser.parse()
+
+    def work(i: int) -> bool:
+        for _ in range(ROUNDS):
+            if i == 0:
+                parser.parse()
+                continue
+
+            key = f"k{i % KEYS}"
+
+            if parser.get_entry(key).__call__() != i % KEYS:
+                return False
+
+        return True
+
+    assert all(run_all(work))
+
+
+def test_concurrent_writes_are_atomic() -> None:
+    entry = DictEntry(resolve=False)
+    writers = THREADS // 2
+
+    def work(i: int) -> bool:
+        for j in range(ROUNDS):
+            if i < writers:
+                uid = entry.uid
+                entry[f"{i}.{j}"] = FieldEntry(key="x", value=j)
+
+                if entry.uid == uid:
+                    return False
+            else:
+                dict(entry.items())
+
+        return True
+
+    assert all(run_all(work))
+    assert len(entry) == writers * ROUNDS
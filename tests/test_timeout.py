@@ -0,0 +1,147 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+
+main_py = """
+import time
+
+def slow(seconds):
+    time.sleep(seconds)
+    return "done"
+
+def fail():
+    raise RuntimeError("boom")
+"""
+
+config = """
+local: main.py
+fast:
+  module: local
+  source: slow
+  timeout: 1
+  args:
+    seconds: 0
+hanging:
+  module: local
+  source: slow
+  timeout: 0.05
+  args:
+    seconds: 1
+ignored:
+  module: local
+  source: slow
+  timeout: 0.05
+  policy: ignore
+  args:
+    seconds: 1
+default:
+  module: local
+  source: slow
+  timeout: 0.05
+  policy: fallback
+  fallback: offline
+  args:
+    seconds: 1
+referenced:
+  module: local
+  source: fail
+  policy: fallback
+  fallback: .{fast}
+failing:
+  module: local
+  source: fail
+sleepy:
+  module: local
+  source: slow
+  args:
+    seconds: 0.2
+db:
+  module: sqlite3
+  source: connect
+  args:
+    - ":memory:"
+"""
+
+missing_fallback = """
+local: main.py
+bad:
+  module: local
+  source: fail
+  policy: fallback
+"""
+
+DEADLINE = 0.1
+
+
+def _parser(tmp_path: Path, text: str = config) -> ConfigParser:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(text)
+
+    return ConfigParser(cfg_file)
+
+
+def test_timeout(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert out["fast"] == "done"
+
+    with pytest.raises(TimeoutError, match="'hanging' timed out"):
+        out["hanging"]
+
+    assert out["ignored"] is None
+    assert out["default"] == "offline"
+
+
+def test_fallback_reference(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    assert out["referenced"] == "done"
+
+
+def test_default_policy_raises(tmp_path: Path) -> None:
+    out = _parser(tmp_path).parse()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        out["failing"]
+
+
+def test_fallback_required(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="requires a fallback value"):
+        _parser(tmp_path, missing_fallback).parse()
+
+
+def test_deadline(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+
+    start = time.perf_counter()
+
+    with pytest.raises(TimeoutError, match="deadline exceeded before 'fast'"):
+        parser.get_many(["sleepy", "fast"], deadline=DEADLINE)
+
+    assert time.perf_counter() - start < 1
+
+    with pytest.raises(TimeoutError, match="deadline exceeded"):
+        parser.materialize(["fast"], deadline=0)
+
+    assert parser.get_many(["fast", "default"], parallel=2, deadline=1) == {
+        "fast": "done",
+        "default": "offline",
+    }
+
+
+def test_deadline_keeps_late_result(tmp_path: Path) -> None:
+    parser = _parser(tmp_path)
+
+    assert parser.get_many(["sleepy"], deadline=DEADLINE) == {"sleepy": "done"}
+
+
+def test_deadline_keeps_caller_thread(tmp_path: Path) -> None:
+    db = _parser(tmp_path).materialize(["db"], deadline=1)["db"]
+
+    assert db.execute("select 1").fetchone() == (1,)
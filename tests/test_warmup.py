@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from kaizo import ConfigParser
+from kaizo.parser import _fork_checked
+from kaizo.utils import ForkSafetyWarning
+
+main_py = """
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+calls = []
+
+def slow(name):
+    time.sleep(0.05)
+    calls.append(name)
+    return name
+
+def pair(left, right):
+    return (left, right)
+
+def pool():
+    return ThreadPoolExecutor(max_workers=1)
+"""
+
+config = """
+local: main.py
+base:
+  module: local
+  source: slow
+  args:
+    name: base
+a:
+  module: local
+  source: pair
+  args:
+    left: .{base}
+    right: a
+b:
+  module: local
+  source: pair
+  args:
+    left: .{base}
+    right: b
+nested:
+  inner:
+    module: local
+    source: slow
+    args:
+      name: inner
+"""
+
+pool_config = """
+local: main.py
+pool:
+  module: local
+  source: pool
+"""
+
+
+def test_warmup_timings(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    timings = parser.warmup(parallel=4)
+
+    assert set(timings) == {"base", "a", "b", "nested"}
+    assert all(t >= 0 for t in timings.values())
+    assert sorted(parser.local.calls) == ["base", "inner"]
+
+    out = parser.parsed
+
+    assert out["a"] == ("base", "a")
+    assert out["nested"]["inner"] == "inner"
+    assert sorted(parser.local.calls) == ["base", "inner"]
+
+
+def test_warmup_keys(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(config)
+
+    parser = ConfigParser(cfg_file)
+    timings = parser.warmup(["nested.inner"])
+
+    assert list(timings) == ["nested.inner"]
+    assert parser.local.calls == ["inner"]
+
+
+def test_warmup_fork_safety(tmp_path: Path) -> None:
+    module = tmp_path / "main.py"
+    module.write_text(main_py)
+
+    cfg_file = tmp_path / "cfg.yml"
+    cfg_file.write_text(pool_config)
+
+    parser = ConfigParser(cfg_file)
+
+    with pytest.warns(ForkSafetyWarning, match="holds a ThreadPoolExecutor"):
+        parser.warmup(check_fork=True)
+
+    assert parser in _fork_checked
+
+    with pytest.warns(ForkSafetyWarning):
+        assert parser.check_fork_safety() == {"pool": "ThreadPoolExecutor"}
+
+    parser.parsed["pool"].shutdown()